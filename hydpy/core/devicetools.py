@@ -6,7 +6,6 @@ are the most fundamental means to structure HydPy projects.
 # ...from standard library
 from __future__ import division, print_function
 import copy
-import struct
 # ...from site-packages
 from matplotlib import pyplot
 # ...from HydPy
@@ -182,24 +181,21 @@ class Node(Device):
         if fastaccess._sim_ramflag:
             fastaccess.sim[0] = fastaccess._sim_array[idx]
         elif fastaccess._sim_diskflag:
-            raw = fastaccess._sim_file.read(8)
-            fastaccess.sim[0] = struct.unpack('d', raw)
+            fastaccess.sim[0] = fastaccess._sim_file[idx]
 
     def _savedata_sim(self, idx):
         fastaccess = self.sequences.fastaccess
         if fastaccess._sim_ramflag:
             fastaccess._sim_array[idx] = fastaccess.sim[0]
         elif fastaccess._sim_diskflag:
-            raw = struct.pack('d', fastaccess.sim[0])
-            fastaccess._sim_file.write(raw)
+            fastaccess._sim_file[idx] = fastaccess.sim[0]
 
     def _loaddata_obs(self, idx):
         fastaccess = self.sequences.fastaccess
         if fastaccess._obs_ramflag:
             fastaccess.obs[0] = fastaccess._obs_array[idx]
         elif fastaccess._obs_diskflag:
-            raw = fastaccess._obs_file.read(8)
-            fastaccess.obs[0] = struct.unpack('d', raw)
+            fastaccess.obs[0] = fastaccess._obs_file[idx]
 
     def prepare_allseries(self, ramflag=True):
         self.prepare_simseries(ramflag)
@@ -5,6 +5,7 @@ of HydPy projects.
 # import...
 # ...from standard library
 from __future__ import division, print_function
+import collections
 import os
 import sys
 import warnings
@@ -801,6 +802,9 @@ class SequenceManager(object):
 class ConditionManager(object):
     """Manager for condition files."""
 
+    _registry = collections.OrderedDict()
+    _MAXREGISTRYSIZE = 10000
+
     def __init__(self):
         self._BASEDIRECTORY = 'conditions'
         self._projectdirectory = pub.projectname
@@ -953,12 +957,15 @@ class ConditionManager(object):
 
     savepath = property(_getsavepath)
 
-    def loadfile(self, filename, dirname=None):
+    def _getfilepath(self, filename, dirname):
         if not filename.endswith('.py'):
             filename += '.py'
         if dirname is None:
             dirname = os.path.join(pub.conditionmanager.loadpath)
-        filepath = os.path.join(dirname, filename)
+        return os.path.join(dirname, filename)
+
+    def loadfile(self, filename, dirname=None):
+        filepath = self._getfilepath(filename, dirname)
         try:
             with open(filepath) as file_:
                 return file_.read()
@@ -966,5 +973,63 @@ class ConditionManager(object):
             prefix = 'While trying to read the conditions file `%s`' % filepath
             objecttools.augmentexcmessage(prefix)
 
+    def loadcode(self, filename, dirname=None):
+        """Return the compiled code of the given conditions file.
+
+        The code objects are registered by file path and only compiled
+        anew if the modification time (in nanoseconds) or the size of the
+        respective file changed in the meantime.  At most
+        `_MAXREGISTRYSIZE` code objects are kept, the least recently used
+        ones are discarded first:
+
+        >>> import os, tempfile
+        >>> from hydpy.core.filetools import ConditionManager
+        >>> dirname = tempfile.mkdtemp()
+        >>> with open(os.path.join(dirname, 'test.py'), 'w') as file_:
+        ...     _ = file_.write('x = 1')
+        >>> manager = ConditionManager()
+        >>> code = manager.loadcode('test', dirname)
+        >>> manager.loadcode('test.py', dirname) is code
+        True
+
+        Method :func:`ConditionManager.clearregistry` removes single or
+        all registered code objects, so that the next call compiles the
+        file again:
+
+        >>> manager.clearregistry(os.path.join(dirname, 'test.py'))
+        >>> manager.loadcode('test', dirname) is code
+        False
+        >>> manager.clearregistry()
+        """
+        filepath = self._getfilepath(filename, dirname)
+        try:
+            stat = os.stat(filepath)
+            fileinfo = (stat.st_mtime_ns, stat.st_size)
+            key = os.path.abspath(filepath)
+            registry = self._registry
+            registered = registry.get(key)
+            if (registered is None) or (registered[0] != fileinfo):
+                with open(filepath) as file_:
+                    code = compile(file_.read(), filepath, 'exec')
+                registered = (fileinfo, code)
+                registry[key] = registered
+                while len(registry) > self._MAXREGISTRYSIZE:
+                    registry.popitem(last=False)
+            registry.move_to_end(key)
+            return registered[1]
+        except BaseException:
+            prefix = ('While trying to read the conditions file `%s`'
+                      % filepath)
+            objecttools.augmentexcmessage(prefix)
+
+    @classmethod
+    def clearregistry(cls, filepath=None):
+        """Remove the code object registered for the given conditions
+        file or, if no file path is given, all code objects registered
+        by :func:`ConditionManager.loadcode`."""
+        if filepath is None:
+            cls._registry.clear()
+        else:
+            cls._registry.pop(os.path.abspath(filepath), None)
 
 autodoctools.autodoc_module()
@@ -271,6 +271,88 @@ class HydPy(object):
 
     @magictools.printprogress
     def doit(self):
+        """Perform a simulation run over the actual simulation time period.
+
+        Internal data series can be handled in RAM or on disk, where
+        disk mode relies on memory mapped files.  Both ways lead to the
+        same results.  To show this, we define a simple project consisting
+        of a single :mod:`~hydpy.models.hstream_v1` element connecting
+        an inlet node, which provides previously "simulated" data, with
+        an outlet node, which handles observed data:
+
+        >>> import tempfile, numpy
+        >>> from hydpy import pub, Timegrid, Timegrids
+        >>> pub.timegrids = Timegrids(Timegrid('2000.01.01',
+        ...                                    '2000.01.06',
+        ...                                    '1d'))
+        >>> from hydpy.core.devicetools import Node, Element
+        >>> inlet, outlet = Node('inlet'), Node('outlet')
+        >>> element = Element('stream', inlets=inlet, outlets=outlet)
+        >>> from hydpy.models.hstream_v1 import *
+        >>> parameterstep('1d')
+        >>> lag(1.0)
+        >>> damp(0.5)
+        >>> model.parameters.update()
+        >>> element.connect(model)
+        >>> from hydpy.core.hydpytools import HydPy
+        >>> from hydpy.core.selectiontools import Selection
+        >>> HydPy.nmb_instances = 0
+        >>> hp = HydPy()
+        >>> hp.updatedevices(Selection('test', [inlet, outlet], [element]))
+
+        All external and internal data files are stored in a temporary
+        directory:
+
+        >>> dirpath = tempfile.mkdtemp()
+        >>> seqs = (inlet.sequences.sim, outlet.sequences.sim,
+        ...         outlet.sequences.obs, states.qjoints)
+        >>> for seq in seqs:
+        ...     seq.dirpath_ext = dirpath
+        ...     seq.dirpath_int = dirpath
+        ...     seq.filetype_ext = 'npy'
+        >>> for (seq, values) in ((inlet.sequences.sim, [1., 5., 3., 0., 2.]),
+        ...                       (outlet.sequences.obs, [0., 1., 2., 3., 4.])):
+        ...     numpy.save(seq.filepath_ext,
+        ...                numpy.concatenate([pub.timegrids.init.toarray(),
+        ...                                   values]))
+        >>> inlet.routingmode = 'oldsim'
+
+        The following test function activates either the RAM or the disk
+        mode, performs a simulation run and prints the resulting series:
+
+        >>> from hydpy.core.objecttools import round_
+        >>> def test(ramflag):
+        ...     for seq in seqs:
+        ...         if ramflag:
+        ...             seq.activate_ram()
+        ...         else:
+        ...             seq.activate_disk()
+        ...     states.qjoints(0.0)
+        ...     hp.doit()
+        ...     round_(inlet.sequences.sim.series)
+        ...     round_(outlet.sequences.sim.series)
+        ...     round_(outlet.sequences.obs.series)
+        ...     round_(outlet.sequences.obs.value)
+        ...     round_(states.qjoints.series[:, 1])
+        ...     for seq in seqs:
+        ...         if ramflag:
+        ...             seq.deactivate_ram()
+        ...         else:
+        ...             seq.deactivate_disk()
+
+        >>> test(ramflag=True)
+        1.0, 5.0, 3.0, 0.0, 2.0
+        0.333333, 2.111111, 3.37037, 2.123457, 1.374486
+        0.0, 1.0, 2.0, 3.0, 4.0
+        4.0
+        0.333333, 2.111111, 3.37037, 2.123457, 1.374486
+        >>> test(ramflag=False)
+        1.0, 5.0, 3.0, 0.0, 2.0
+        0.333333, 2.111111, 3.37037, 2.123457, 1.374486
+        0.0, 1.0, 2.0, 3.0, 4.0
+        4.0
+        0.333333, 2.111111, 3.37037, 2.123457, 1.374486
+        """
         idx_start, idx_end = self.simindices
         self.openfiles(idx_start)
         funcorder = self.funcorder
@@ -50,7 +50,12 @@ class Model(_MetaModel):
     def _init_methods(self):
         """Convert all pure Python run and add functions of the model class to
         methods and assign them to the model instance.
+
+        Additionally, the run methods to be called by :func:`Model.run`
+        (all except the `update` methods) are collected once in the
+        tuple `_runmethods`, to spare filtering them each simulation step.
         """
+        runmethods = []
         for tuplename in ('_RUNMETHODS', '_ADDMETHODS'):
             functions = getattr(self, tuplename, ())
             uniques = {}
@@ -58,6 +63,9 @@ class Model(_MetaModel):
                 name = func.__name__
                 method = types.MethodType(func, self)
                 setattr(self, name, method)
+                if ((tuplename == '_RUNMETHODS') and
+                        not name.startswith('update_')):
+                    runmethods.append(method)
                 shortname = '_'.join(name.split('_')[:-1])
                 if shortname in uniques:
                     uniques[shortname] = None
@@ -66,6 +74,7 @@ class Model(_MetaModel):
             for (shortname, method) in uniques.items():
                 if method is not None:
                     setattr(self, shortname, method)
+        self._runmethods = tuple(runmethods)
 
     def connect(self):
         """Connect the link sequences of the actual model."""
@@ -131,9 +140,8 @@ class Model(_MetaModel):
         self.savedata()
 
     def run(self):
-        for method in self._RUNMETHODS:
-            if not method.__name__.startswith('update_'):
-                method(self)
+        for method in self._runmethods:
+            method()
 
     def loaddata(self):
         self.sequences.loaddata(self.idx_sim)
@@ -5,6 +5,7 @@ of the different objects defined by the HydPy framework.
 # import...
 # ...from standard library
 from __future__ import division, print_function
+import functools
 import inspect
 import sys
 import textwrap
@@ -68,7 +69,14 @@ def classname(self):
     """
     if not inspect.isclass(self):
         self = type(self)
-    return str(self).split("'")[1].split('.')[-1]
+    return _classname(self)
+
+
+@functools.lru_cache(maxsize=None)
+def _classname(cls):
+    """Cached part of :func:`classname`, which only depends on the
+    given class."""
+    return str(cls).split("'")[1].split('.')[-1]
 
 
 def instancename(self):
@@ -80,7 +88,16 @@ def instancename(self):
     >>> print(instancename(options))
     options
     """
-    return classname(self).lower()
+    if not inspect.isclass(self):
+        self = type(self)
+    return _instancename(self)
+
+
+@functools.lru_cache(maxsize=None)
+def _instancename(cls):
+    """Cached part of :func:`instancename`, which only depends on the
+    given class."""
+    return _classname(cls).lower()
 
 
 def modulename(self):
@@ -91,7 +108,14 @@ def modulename(self):
     >>> print(modulename(options))
     objecttools
     """
-    return self.__module__.split('.')[-1]
+    return _modulename(self.__module__)
+
+
+@functools.lru_cache(maxsize=None)
+def _modulename(name):
+    """Cached part of :func:`modulename`, which only depends on the
+    qualified module name."""
+    return name.split('.')[-1]
 
 
 def devicename(self):
@@ -573,6 +597,7 @@ class Options(object):
         self._warnmissingobsfile = True
         self._warnmissingsimfile = True
         self._usedefaultvalues = False
+        self._iothreads = 0
 
     def _getprintprogress(self):
         """True/False flag indicating whether information about the progress
@@ -750,6 +775,18 @@ class Options(object):
     usedefaultvalues = property(_getusedefaultvalues,
                                 _setusedefaultvalues)
 
+    def _getiothreads(self):
+        """Number of threads used for loading the external data files of
+        the input sequences of a model simultaneously.  Values smaller
+        than two result in sequential loading, which is the default.
+        """
+        return self._iothreads
+
+    def _setiothreads(self, value):
+        self._iothreads = int(value)
+
+    iothreads = property(_getiothreads, _setiothreads)
+
     __dir__ = dir_
 
 
@@ -4,12 +4,13 @@ of hydrological models.
 """
 # import...
 # ...from standard library
-from __future__ import division, print_function
 import os
 import sys
 import copy
-import struct
+import functools
+import collections
 import warnings
+import concurrent.futures
 # ...from site-packages
 import numpy
 # ...from HydPy
@@ -19,11 +20,30 @@ from hydpy.core import objecttools
 from hydpy.cythons import pointer
 from hydpy.core import autodoctools
 
+_SCALARTYPES = (float, int, numpy.floating, numpy.integer)
+"""Types of single values which can be converted to :class:`float`
+directly."""
+
+_ARRAYTYPES = (numpy.ndarray,) + _SCALARTYPES
+"""Types of values assigned to multidimensional sequences, which do not
+need to be checked for a `value` attribute."""
+
 
 class Sequences(object):
     """Base class for handling all sequences of a specific model."""
 
+    _HANDLERNAMES = ('activate_disk', 'deactivate_disk',
+                     'activate_ram', 'deactivate_ram',
+                     'openfiles', 'closefiles',
+                     'loaddata', 'savedata', 'reset')
+    """Names of the methods, which are passed to all handled
+    :class:`SubSequences` objects implementing them."""
+
     def __init__(self, kwargs):
+        self._handlers = {}
+        self._nmbsubseqs = 0
+        self._hasconditions = None
+        self._conditionfilename = (None, None)
         self.model = kwargs.get('model')
         cythonmodule = kwargs.get('cythonmodule')
         cymodel = kwargs.get('cymodel')
@@ -36,53 +56,73 @@ class Sequences(object):
                     subseqs = cls(self, None, None)
                 setattr(self, subseqs.name, subseqs)
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if isinstance(value, SubSequences):
+            self._inithandlers()
+        elif name == 'model':
+            object.__setattr__(self, '_conditionfilename', (None, None))
+
+    def __delattr__(self, name):
+        object.__delattr__(self, name)
+        self._inithandlers()
+
+    def _inithandlers(self):
+        """Collect, for each name of :attr:`~Sequences._HANDLERNAMES`, the
+        respective methods of all handled :class:`SubSequences` objects
+        declaring them in their :attr:`~SubSequences._HOOKS` set once, so
+        that the dispatching methods of :class:`Sequences` do not need to
+        query the availability of these methods on each call."""
+        handlers = dict((name, []) for name in self._HANDLERNAMES)
+        nmbsubseqs = 0
+        for (name, subseqs) in self:
+            nmbsubseqs += 1
+            hooks = subseqs._HOOKS
+            for (handlername, methods) in handlers.items():
+                if handlername in hooks:
+                    methods.append(getattr(subseqs, handlername))
+        object.__setattr__(self, '_handlers', handlers)
+        object.__setattr__(self, '_nmbsubseqs', nmbsubseqs)
+        object.__setattr__(self, '_hasconditions', None)
+
     def set_initvals(self, info, idx_date):
         self.states.set_initvals(info, idx_date)
 
     def activate_disk(self, names=None):
-        for (name, subseqs) in self:
-            if hasattr(subseqs, 'activate_disk'):
-                subseqs.activate_disk(names)
+        for method in self._handlers['activate_disk']:
+            method(names)
 
     def deactivate_disk(self, names=None):
-        for (name, subseqs) in self:
-            if hasattr(subseqs, 'deactivate_disk'):
-                subseqs.deactivate_disk(names)
+        for method in self._handlers['deactivate_disk']:
+            method(names)
 
     def activate_ram(self, names=None):
-        for (name, subseqs) in self:
-            if hasattr(subseqs, 'activate_ram'):
-                subseqs.activate_ram(names)
+        for method in self._handlers['activate_ram']:
+            method(names)
 
     def deactivate_ram(self, names=None):
-        for (name, subseqs) in self:
-            if hasattr(subseqs, 'deactivate_ram'):
-                subseqs.deactivate_ram(names)
+        for method in self._handlers['deactivate_ram']:
+            method(names)
 
     def openfiles(self, idx=0):
-        for (name, subseqs) in self:
-            if hasattr(subseqs, 'openfiles'):
-                subseqs.openfiles(idx)
+        for method in self._handlers['openfiles']:
+            method(idx)
 
     def closefiles(self):
-        for (name, subseqs) in self:
-            if hasattr(subseqs, 'closefiles'):
-                subseqs.closefiles()
+        for method in self._handlers['closefiles']:
+            method()
 
     def loaddata(self, idx):
-        for (name, subseqs) in self:
-            if hasattr(subseqs, 'loaddata'):
-                subseqs.loaddata(idx)
+        for method in self._handlers['loaddata']:
+            method(idx)
 
     def savedata(self, idx):
-        for (name, subseqs) in self:
-            if hasattr(subseqs, 'savedata'):
-                subseqs.savedata(idx)
+        for method in self._handlers['savedata']:
+            method(idx)
 
     def reset(self):
-        for (name, subseqs) in self:
-            if hasattr(subseqs, 'reset'):
-                subseqs.reset()
+        for method in self._handlers['reset']:
+            method()
 
     def __iter__(self):
         for (key, value) in vars(self).items():
@@ -102,13 +142,20 @@ class Sequences(object):
     def hasconditions(self):
         """True or False, whether the :class:`Sequences` object handles at
         conditions (at least one :class:`StateSequence` or :class:`LogSequence`
-        object)  or not."""
-        for tuple_ in self.conditions:
-            return True
-        return False
+        object)  or not.
+
+        The result is determined once and only reevaluated after adding
+        or removing :class:`SubSequences` objects."""
+        if self._hasconditions is None:
+            self._hasconditions = any(True for _ in self.conditions)
+        return self._hasconditions
 
     @property
     def _conditiondefaultfilename(self):
+        element = getattr(self.model, 'element', None)
+        (cachedelement, filename) = self._conditionfilename
+        if (filename is not None) and (cachedelement is element):
+            return filename
         filename = objecttools.devicename(self)
         if filename == '?':
             raise RuntimeError(
@@ -120,7 +167,9 @@ class Sequences(object):
                 'handling the model.  Actually, neither a filename is given '
                 'nor does the model know its master element.')
         else:
-            return filename + '.py'
+            filename += '.py'
+            self._conditionfilename = (element, filename)
+            return filename
 
     def loadconditions(self, filename=None, dirname=None):
         """Load initial conditions from a file and assign them to the
@@ -129,17 +178,15 @@ class Sequences(object):
         if self.hasconditions:
             if filename is None:
                 filename = self._conditiondefaultfilename
-            namespace = locals()
-            for (name, seq) in self.conditions:
-                namespace[name] = seq
+            namespace = dict(self.conditions)
             namespace['model'] = self
-            code = pub.conditionmanager.loadfile(filename, dirname)
+            code = pub.conditionmanager.loadcode(filename, dirname)
             try:
-                exec(code)
+                exec(code, globals(), namespace)
             except BaseException:
-                objecttools.augmentexcmessage('While trying to gather initial '
-                                              'conditions of element %s'
-                                              % objecttools.devicename(self))
+                objecttools.augmentexcmessage(
+                    'While trying to gather initial conditions of element '
+                    f'{objecttools.devicename(self)}')
 
     def saveconditions(self, filename=None, dirname=None):
         if self.hasconditions:
@@ -150,25 +197,28 @@ class Sequences(object):
             if dirname is None:
                 dirname = pub.conditionmanager.savepath
             filepath = os.path.join(dirname, filename)
+            modelname = self.model.__module__.split('.')[2]
+            lines = [f'from hydpy.models.{modelname} import *\n\n']
+            try:
+                projectdir = pub.controlmanager.projectdirectory
+                controldir = pub.controlmanager.controldirectory
+                lines.append(f'controlcheck(projectdir="{projectdir}", '
+                             f'controldir="{controldir}")\n\n')
+            except BaseException:
+                pass
+            for (name, seq) in self.conditions:
+                lines.append(repr(seq) + '\n')
             with open(filepath, 'w') as file_:
-                file_.write('from hydpy.models.%s import *\n\n'
-                            % self.model.__module__.split('.')[2])
-                try:
-                    line = ('controlcheck(projectdir="%s", controldir="%s")'
-                            % (pub.controlmanager.projectdirectory,
-                               pub.controlmanager.controldirectory))
-                    file_.write(line + '\n\n')
-                except BaseException:
-                    pass
-                for (name, seq) in self.conditions:
-                    file_.write(repr(seq) + '\n')
+                file_.write(''.join(lines))
+            if pub.conditionmanager is not None:
+                pub.conditionmanager.clearregistry(filepath)
 
     def trimconditions(self):
         for (name, seq) in self.conditions:
             seq.trim()
 
     def __len__(self):
-        return len(dict(self))
+        return self._nmbsubseqs
 
 
 class MetaSubSequencesType(type):
@@ -176,17 +226,18 @@ class MetaSubSequencesType(type):
         seqclasses = dict_.get('_SEQCLASSES')
         if seqclasses is None:
             raise NotImplementedError(
-                'For class `%s`, the required tuple `_SEQCLASSES` is not '
+                f'For class `{name}`, the required tuple `_SEQCLASSES` is not '
                 'defined.  Please see the documentation of class '
                 '`SubSequences` of module `sequencetools` for further '
-                'information.' % name)
+                'information.')
+        dict_['_SEQNAMES'] = tuple(objecttools.instancename(seqclass)
+                                   for seqclass in seqclasses)
         if seqclasses:
             lst = ['\n\n\n    The following sequence classes are selected:']
             for seqclass in seqclasses:
-                    lst.append('      * :class:`~%s` `%s`'
-                               % ('.'.join((seqclass.__module__,
-                                            seqclass.__name__)),
-                                  autodoctools.description(seqclass)))
+                    path = '.'.join((seqclass.__module__, seqclass.__name__))
+                    description = autodoctools.description(seqclass)
+                    lst.append(f'      * :class:`~{path}` `{description}`')
             doc = dict_.get('__doc__', None)
             if doc is None:
                 doc = ''
@@ -242,8 +293,20 @@ class SubSequences(MetaSubSequencesClass):
     ...
     NotImplementedError: For class `InputSequences`, the required tuple `_SEQCLASSES` is not defined.  Please see the documentation of class `SubSequences` of module `sequencetools` for further information.
 
+    Subclasses of :class:`SubSequences` list the names of those methods
+    of theirs the master :class:`Sequences` object shall call (e.g.
+    `loaddata`) in the (hidden) class attribute
+    :attr:`~SubSequences._HOOKS`:
+
+    >>> from hydpy.core.sequencetools import InputSequences, LogSequences
+    >>> sorted(InputSequences._HOOKS)   # doctest: +NORMALIZE_WHITESPACE
+    ['activate_disk', 'activate_ram', 'closefiles', 'deactivate_disk',
+     'deactivate_ram', 'loaddata', 'openfiles']
+    >>> sorted(LogSequences._HOOKS)
+    ['reset']
     """
     _SEQCLASSES = ()
+    _HOOKS = frozenset()
 
     def __init__(self, seqs, cls_fastaccess=None, cymodel=None):
         self.seqs = seqs
@@ -258,8 +321,8 @@ class SubSequences(MetaSubSequencesClass):
             setattr(cymodel, self.name, self.fastaccess)
 
     def _initsequences(self):
-        for cls_seq in self._SEQCLASSES:
-            setattr(self, objecttools.instancename(cls_seq), cls_seq())
+        for (name, cls_seq) in zip(self._SEQNAMES, self._SEQCLASSES):
+            setattr(self, name, cls_seq())
 
     @classmethod
     def getname(cls):
@@ -269,6 +332,59 @@ class SubSequences(MetaSubSequencesClass):
     def name(self):
         return self.getname()
 
+    def setshapes(self, shape, exclude=()):
+        """Set the same shape for all handled sequences with a matching
+        dimensionality, except for those named in `exclude`.
+
+        The values of all selected sequences are stored in the rows of
+        a single contiguous :class:`~numpy.ndarray`, so that calculations
+        iterating over these sequences access neighbouring memory.  Still,
+        each sequence handles its own values independently.  See the
+        documentation on parameter
+        :class:`~hydpy.models.hland.hland_control.NmbZones` for an example.
+
+        Only sequences relying on the standard shape handling of classes
+        :class:`Sequence`, :class:`IOSequence` and :class:`StateSequence`
+        become part of the block, as only these are known to keep an
+        already existing array of the correct shape.  All other sequences
+        are shaped individually by their own (overridden) shape setter.
+        For example, :class:`LinkSequence` objects handle pointers
+        instead of arrays, which must not be replaced by block rows:
+
+        >>> from hydpy.core.sequencetools import LinkSequence, LinkSequences
+        >>> class Q(LinkSequence):
+        ...     NDIM, NUMERIC = 1, False
+        >>> class Links(LinkSequences):
+        ...     _SEQCLASSES = (Q,)
+        >>> links = Links(None)
+        >>> links.setshapes(3)
+        >>> links.q.shape
+        (3,)
+        >>> links.fastaccess.q   # doctest: +ELLIPSIS
+        <hydpy.cythons.pointer.PPDouble object at ...>
+        """
+        self._setshapes(shape, exclude)
+
+    def _setshapes(self, shape, exclude):
+        """Perform the actual work of :meth:`~SubSequences.setshapes` and
+        return the sequences stored in the block and the block itself."""
+        try:
+            shapetuple = tuple(shape)
+        except TypeError:
+            shapetuple = (shape,)
+        seqs = []
+        for (name, seq) in self:
+            if (seq.NDIM == len(shapetuple)) and (name not in exclude):
+                if type(seq).shape.fset in _BLOCKSHAPESETTERS:
+                    seqs.append(seq)
+                else:
+                    seq.shape = shape
+        block = numpy.empty((len(seqs),)+shapetuple, dtype=float)
+        for (seq, array) in zip(seqs, block):
+            setattr(self.fastaccess, seq.name, array)
+            seq.shape = shapetuple
+        return seqs, block
+
     def __setattr__(self, name, value):
         """Attributes and methods should usually not be replaced.  Existing
         :class:`Sequence` attributes are protected in a way, that only their
@@ -276,6 +392,10 @@ class SubSequences(MetaSubSequencesClass):
         attributes, additional `fastaccess` references are defined.  If you
         actually want to replace a sequence, you have to delete it first.
         """
+        attr = self.__dict__.get(name)
+        if isinstance(attr, Sequence):
+            attr.values = value
+            return
         try:
             attr = getattr(self, name)
         except AttributeError:
@@ -286,18 +406,19 @@ class SubSequences(MetaSubSequencesClass):
             try:
                 attr.values = value
             except AttributeError:
-                raise RuntimeError('`%s` instances do not allow the direct'
-                                   'replacement of their members.  After '
-                                   'initialization you should usually only '
-                                   'change parameter values through '
+                raise RuntimeError(f'`{objecttools.classname(self)}` '
+                                   'instances do not allow the '
+                                   'directreplacement of their members.  '
+                                   'After initialization you should usually '
+                                   'only change parameter values through '
                                    'assignements.  If you really need to '
                                    'replace a object member, delete it '
-                                   'beforehand.' % objecttools.classname(self))
+                                   'beforehand.')
 
     def __iter__(self):
-        for seqclass in self._SEQCLASSES:
-            name = objecttools.instancename(seqclass)
-            yield name, getattr(self, name)
+        dict_ = self.__dict__
+        for name in self._SEQNAMES:
+            yield name, dict_[name]
 
     def __getitem__(self, key):
         return self.__dict__[key]
@@ -305,16 +426,15 @@ class SubSequences(MetaSubSequencesClass):
     def __repr__(self):
         lines = []
         if pub.options.reprcomments:
-            lines.append('#%s object defined in module %s.'
-                         % (objecttools.classname(self),
-                            objecttools.modulename(self)))
+            lines.append(f'#{objecttools.classname(self)} object defined in '
+                         f'module {objecttools.modulename(self)}.')
             lines.append('#The implemented sequences with their actual '
                          'values are:')
         for (name, sequence) in self:
             try:
-                lines.append('%s' % repr(sequence))
+                lines.append(repr(sequence))
             except BaseException:
-                lines.append('%s(?)' % name)
+                lines.append(f'{name}(?)')
         return '\n'.join(lines)
 
     def __dir__(self):
@@ -323,6 +443,9 @@ class SubSequences(MetaSubSequencesClass):
 
 class IOSubSequences(SubSequences):
     _SEQCLASSES = ()
+    _HOOKS = frozenset(('openfiles', 'closefiles',
+                        'activate_ram', 'deactivate_ram',
+                        'activate_disk', 'deactivate_disk'))
 
     def openfiles(self, idx=0):
         self.fastaccess.openfiles(idx)
@@ -358,14 +481,76 @@ class IOSubSequences(SubSequences):
 class InputSequences(IOSubSequences):
     """Base class for handling input sequences."""
     _SEQCLASSES = ()
+    _HOOKS = IOSubSequences._HOOKS.union(('loaddata',))
 
     def loaddata(self, idx):
         self.fastaccess.loaddata(idx)
 
+    def activate_ram(self):
+        self._activate('activate_ram')
+
+    def activate_disk(self):
+        self._activate('activate_disk')
+
+    def _activate(self, methodname):
+        """Call the given activation method of all input sequences, which
+        includes reading their external data files.  If option
+        :attr:`~hydpy.core.objecttools.Options.iothreads` is larger than
+        one, the files are read by multiple threads simultaneously.
+
+        Both ways result in the same series:
+
+        >>> import os, tempfile, numpy
+        >>> from hydpy import pub, Timegrid, Timegrids
+        >>> pub.timegrids = Timegrids(Timegrid('2000.01.01',
+        ...                                    '2000.01.04',
+        ...                                    '1d'))
+        >>> from hydpy.core.sequencetools import InputSequence, InputSequences
+        >>> class P(InputSequence):
+        ...     NDIM, NUMERIC = 0, False
+        >>> class T(InputSequence):
+        ...     NDIM, NUMERIC = 0, False
+        >>> class Inputs(InputSequences):
+        ...     _SEQCLASSES = (P, T)
+        >>> inputs = Inputs(None)
+        >>> dirpath = tempfile.mkdtemp()
+        >>> for (idx, (name, seq)) in enumerate(inputs):
+        ...     seq.filetype_ext = 'npy'
+        ...     seq.dirpath_ext = dirpath
+        ...     seq.rawfilename = name
+        ...     numpy.save(seq.filepath_ext,
+        ...                numpy.concatenate([pub.timegrids.init.toarray(),
+        ...                                   numpy.arange(3.)+idx]))
+        >>> from hydpy.core.objecttools import round_
+        >>> inputs.activate_ram()
+        >>> round_(inputs.p.series)
+        0.0, 1.0, 2.0
+        >>> round_(inputs.t.series)
+        1.0, 2.0, 3.0
+        >>> inputs.deactivate_ram()
+        >>> pub.options.iothreads = 2
+        >>> inputs.activate_ram()
+        >>> round_(inputs.p.series)
+        0.0, 1.0, 2.0
+        >>> round_(inputs.t.series)
+        1.0, 2.0, 3.0
+        >>> pub.options.iothreads = 0
+        """
+        methods = [getattr(seq, methodname) for (name, seq) in self]
+        nmbthreads = pub.options.iothreads
+        if min(nmbthreads, len(methods)) < 2:
+            for method in methods:
+                method()
+        else:
+            executor = _getexecutor(nmbthreads)
+            for future in [executor.submit(method) for method in methods]:
+                future.result()
+
 
 class FluxSequences(IOSubSequences):
     """Base class for handling flux sequences."""
     _SEQCLASSES = ()
+    _HOOKS = IOSubSequences._HOOKS.union(('savedata',))
 
     @classmethod
     def getname(cls):
@@ -378,6 +563,7 @@ class FluxSequences(IOSubSequences):
 class StateSequences(IOSubSequences):
     """Base class for handling state sequences."""
     _SEQCLASSES = ()
+    _HOOKS = IOSubSequences._HOOKS.union(('savedata', 'reset'))
 
     def _initfastaccess(self, cls_fastaccess, cymodel):
         SubSequences._initfastaccess(self, cls_fastaccess, cymodel)
@@ -388,13 +574,50 @@ class StateSequences(IOSubSequences):
             setattr(cymodel, 'new_states', self.fastaccess)
             self.fastaccess_old = cls_fastaccess()
             setattr(cymodel, 'old_states', self.fastaccess_old)
+        object.__setattr__(self, '_blocks', None)
+        object.__setattr__(self, '_blocknames', frozenset())
+
+    def setshapes(self, shape, exclude=()):
+        """Set the same shape for all handled sequences with a matching
+        dimensionality, except for those named in `exclude`.
+
+        Additionally to the new state values (see method
+        :meth:`SubSequences.setshapes`), the old state values of the
+        selected sequences are stored in the rows of a second block,
+        which allows :meth:`~StateSequences.new2old` to copy them at once.
+        """
+        (seqs, newblock) = self._setshapes(shape, exclude)
+        oldblock = newblock.copy()
+        for (seq, array) in zip(seqs, oldblock):
+            setattr(self.fastaccess_old, seq.name, array)
+        object.__setattr__(self, '_blocks', (newblock, oldblock))
+        object.__setattr__(
+            self, '_blocknames', frozenset(seq.name for seq in seqs))
+
+    def _unblock(self, name):
+        """Exclude the sequence with the given name from the block-wise
+        copying of :meth:`~StateSequences.new2old`, due to its values
+        having been replaced by arrays not belonging to the blocks."""
+        if name in self._blocknames:
+            object.__setattr__(
+                self, '_blocknames', self._blocknames.difference((name,)))
 
     def new2old(self):
         """Assign the new/final state values of the actual time step to the
         new/initial state values of the next time step.
+
+        The values of all sequences shaped via method
+        :meth:`~StateSequences.setshapes` are copied at once.  See the
+        documentation on parameter
+        :class:`~hydpy.models.hland.hland_control.NmbZones` for an example.
         """
+        blocks = self._blocks
+        if blocks is not None:
+            numpy.copyto(blocks[1], blocks[0])
+        blocknames = self._blocknames
         for (name, seq) in self:
-            seq.new2old()
+            if name not in blocknames:
+                seq.new2old()
 
     def savedata(self, idx):
         self.fastaccess.savedata(idx)
@@ -407,6 +630,7 @@ class StateSequences(IOSubSequences):
 class LogSequences(SubSequences):
     """Base class for handling log sequences."""
     _SEQCLASSES = ()
+    _HOOKS = frozenset(('reset',))
 
     def reset(self):
         for (name, seq) in self:
@@ -423,26 +647,66 @@ class LinkSequences(SubSequences):
     _SEQCLASSES = ()
 
 
+class _SeqFastAccess(object):
+    """Python side mirror of the sequence specific members of a
+    :class:`FastAccess` object (or its Cython counterpart).
+
+    Each :class:`Sequence` object stores the information it writes
+    into the `fastaccess` object of its :class:`SubSequences` object
+    additionally in a :class:`_SeqFastAccess` object, allowing to read
+    it via simple slot access instead of formatting member names like
+    `_seq1_diskflag` on each query.
+    """
+    __slots__ = ('ndim', 'length', 'lengths',
+                 'diskflag', 'ramflag', 'path', 'array')
+
+    def __init__(self):
+        self.ndim = 0
+        self.length = 0
+        self.lengths = None
+        self.diskflag = None
+        self.ramflag = None
+        self.path = None
+        self.array = None
+
+
 class Sequence(objecttools.ValueMath):
     """Only for inheritance."""
 
     NDIM, NUMERIC = 0, False
 
     def __init__(self):
+        self._name = objecttools.instancename(self)
+        self._members = _membernames(self._name)
         self.subseqs = None
         self.fastaccess = type('FastAccess', (), {})
+        self._fa = _SeqFastAccess()
 
     def connect(self, subseqs):
+        """Connect the sequence with the given subgroup and prepare the
+        related members of its `fastaccess` object.  Connecting a sequence
+        to the subgroup it is already connected with does not change
+        anything."""
+        if subseqs is self.subseqs:
+            return
         self.subseqs = subseqs
         self.fastaccess = subseqs.fastaccess
-        setattr(self.fastaccess, '_%s_ndim' % self.name, self.NDIM)
-        setattr(self.fastaccess, '_%s_length' % self.name, 0)
+        members = self._members
+        setattr(self.fastaccess, members.ndim, self.NDIM)
+        setattr(self.fastaccess, members.length, 0)
         for idx in range(self.NDIM):
-            setattr(self.fastaccess, '_%s_length_%d' % (self.name, idx), 0)
+            setattr(self.fastaccess, f'{members.length}_{idx}', 0)
+        self._fa.ndim = self.NDIM
+        self._fa.length = 0
+        self._fa.lengths = None
         self.diskflag = False
         self.ramflag = False
         try:
-            setattr(self.fastaccess, '_%s_file' % self.name, '')
+            setattr(self.fastaccess, members.file, '')
+        except AttributeError:
+            pass
+        try:
+            self.fastaccess.registername(self.name)
         except AttributeError:
             pass
         self._initvalues()
@@ -474,35 +738,93 @@ class Sequence(objecttools.ValueMath):
         """Name of the sequence, which is the name if the instantiating
         subclass of :class:`Sequence` in lower case letters.
         """
-        return objecttools.classname(self).lower()
+        return self._name
     name = property(_getname)
 
     def _getvalue(self):
         """The actual time series value(s) handled by the respective
         :class:`Sequence` instance.  For consistency, `value` and `values`
         can always be used interchangeably.
+
+        New values of multidimensional sequences are written into the
+        already existing array.  Hence, arrays previously queried via
+        `values` reflect later assignments:
+
+        >>> from hydpy.core.sequencetools import Sequence, SubSequences
+        >>> class Temperature(Sequence):
+        ...    NDIM, NUMERIC = 1, False
+        >>> class InputSequences(SubSequences):
+        ...     _SEQCLASSES = (Temperature,)
+        >>> temperature = InputSequences(None).temperature
+        >>> temperature.shape = 3
+        >>> temperature.values = 1., 2., 3.
+        >>> values = temperature.values
+        >>> temperature.values = 4., 5., 6.
+        >>> from hydpy.core.objecttools import round_
+        >>> round_(values)
+        4.0, 5.0, 6.0
+
+        If the new values cannot be converted, the old ones remain
+        untouched:
+
+        >>> temperature.values = 7., 'x', 9.
+        Traceback (most recent call last):
+        ...
+        ValueError: For sequence temperature of element ? setting new \
+values failed.  The values `(7.0, 'x', 9.0)` cannot be converted to a numpy \
+ndarray with shape (3,) containing entries of type float.
+        >>> round_(temperature.values)
+        4.0, 5.0, 6.0
+
+        Single numbers and float arrays broadcastable to the sequence's
+        shape are copied directly into the existing array without creating
+        any temporary array:
+
+        >>> import numpy
+        >>> temperature.values = 2.
+        >>> temperature.values is values
+        True
+        >>> temperature.values = numpy.array([1., 2., 3.])
+        >>> temperature.values is values
+        True
+        >>> round_(values)
+        1.0, 2.0, 3.0
+
+        Arrays with an incompatible shape are still rejected as a whole:
+
+        >>> temperature.values = numpy.array([1., 2.])  # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+        ...
+        ValueError: For sequence temperature of element ? setting new \
+values failed.  The values `...` cannot be converted to a numpy \
+ndarray with shape (3,) containing entries of type float.
+        >>> round_(values)
+        1.0, 2.0, 3.0
         """
-        value = getattr(self.fastaccess, self.name, None)
+        value = getattr(self.fastaccess, self._name, None)
         if value is None:
-            raise RuntimeError('No value/values of sequence %s of element '
-                               '%s has/have been defined so far.'
-                               % (self.name, objecttools.devicename(self)))
+            raise RuntimeError(f'No value/values of sequence {self.name} of '
+                               f'element {objecttools.devicename(self)} '
+                               'has/have been defined so far.')
         else:
-            if self.NDIM:
+            # Only the typed memoryviews of Cython mode need a conversion.
+            if self.NDIM and not isinstance(value, numpy.ndarray):
                 value = numpy.asarray(value)
             return value
 
     def _setvalue(self, value):
         if self.NDIM == 0:
+            if isinstance(value, _SCALARTYPES):
+                setattr(self.fastaccess, self.name, float(value))
+                return
             try:
                 temp = value[0]
                 if len(value) > 1:
-                    raise ValueError('%d values are assigned to the scalar '
-                                     'sequence %s of element %s, which is '
-                                     'ambiguous.'
-                                     % (len(value),
-                                        objecttools.devicename(self),
-                                        self.name))
+                    raise ValueError(
+                        f'{len(value)} values are assigned to the scalar '
+                        f'sequence {self.name} of element '
+                        f'{objecttools.devicename(self)}, which is '
+                        'ambiguous.')
                 value = temp
             except (TypeError, IndexError):
                 pass
@@ -510,28 +832,52 @@ class Sequence(objecttools.ValueMath):
                 value = float(value)
             except (ValueError, TypeError):
                 raise TypeError('When trying to set the value of sequence '
-                                '%s of element %s, it was not possible to '
-                                'convert value `%s` to float .'
-                                % (self.name, objecttools.devicename(self),
-                                   value))
+                                f'{self.name} of element '
+                                f'{objecttools.devicename(self)}, it was not '
+                                f'possible to convert value `{value}` to '
+                                'float .')
         else:
-            try:
-                value = value.value
-            except AttributeError:
-                pass
+            array = getattr(self.fastaccess, self.name, None)
+            if (array is not None) and (
+                    isinstance(value, _SCALARTYPES) or
+                    (isinstance(value, numpy.ndarray) and
+                     (value.dtype.kind == 'f'))):
+                # Broadcasting is checked before copying anything, so
+                # float values can be written without a temporary array.
+                try:
+                    numpy.copyto(numpy.asarray(array), value)
+                    return
+                except ValueError:
+                    pass
+            if not isinstance(value, _ARRAYTYPES):
+                try:
+                    value = value.value
+                except AttributeError:
+                    pass
             try:
                 value = numpy.full(self.shape, value, dtype=float)
             except ValueError:
-                raise ValueError('For sequence %s of element %s setting new '
-                                 'values failed.  The values `%s` cannot be '
-                                 'converted to a numpy ndarray with shape %s '
-                                 'containing entries of type float.'
-                                 % (self.name, objecttools.devicename(self),
-                                    value, self.shape))
+                raise ValueError(f'For sequence {self.name} of element '
+                                 f'{objecttools.devicename(self)} setting new '
+                                 f'values failed.  The values `{value}` '
+                                 'cannot be converted to a numpy ndarray with '
+                                 f'shape {self.shape} containing entries of '
+                                 'type float.')
+            if array is not None:
+                # Write the validated values into the already existing
+                # array instead of replacing it.
+                numpy.copyto(numpy.asarray(array), value)
+                return
         setattr(self.fastaccess, self.name, value)
 
     value = property(_getvalue, _setvalue)
     values = value
+    """Synonym of :attr:`~Sequence.value`.  Note that new values of
+    multidimensional sequences are written into the already existing
+    array instead of replacing it.  Hence, arrays previously queried via
+    :attr:`~Sequence.values` reflect all later assignments.  Use their
+    :meth:`~numpy.ndarray.copy` method to keep the current values.
+    """
 
     def _getshape(self):
         """A tuple containing the lengths in all dimensions of the sequence
@@ -543,37 +889,45 @@ class Sequence(objecttools.ValueMath):
             try:
                 return self.values.shape
             except AttributeError:
-                raise RuntimeError('Shape information for sequence %s of '
-                                   'element %s can only be retrieved after '
-                                   'it has been defined.'
-                                   % (self.name,
-                                      objecttools.devicename(self)))
+                raise RuntimeError('Shape information for sequence '
+                                   f'{self.name} of element '
+                                   f'{objecttools.devicename(self)} can only '
+                                   'be retrieved after it has been defined.')
         else:
             return ()
 
     def _setshape(self, shape):
         if self.NDIM:
+            array = getattr(self.fastaccess, self.name, None)
+            if array is not None:
+                array = numpy.asarray(array)
+                try:
+                    sameshape = array.shape == tuple(shape)
+                except TypeError:
+                    sameshape = array.shape == (shape,)
+                if sameshape:
+                    array.fill(self.initvalue)
+                    return
             try:
                 array = numpy.full(shape, self.initvalue, dtype=float)
             except Exception:
                 prefix = ('While trying create a new numpy ndarray` for '
-                          'sequence %s of element %s'
-                          % (self.name, objecttools.devicename(self)))
+                          f'sequence {self.name} of element '
+                          f'{objecttools.devicename(self)}')
                 objecttools.augmentexcmessage(prefix)
             if array.ndim == self.NDIM:
                 setattr(self.fastaccess, self.name, array)
             else:
-                raise ValueError('Sequence %s of element %s is %d-dimensional '
-                                 'but the given shape indicates %d dimensions.'
-                                 % (self.name, objecttools.devicename(self),
-                                    self.NDIM, array.ndim))
+                raise ValueError(f'Sequence {self.name} of element '
+                                 f'{objecttools.devicename(self)} is '
+                                 f'{self.NDIM}-dimensional but the given '
+                                 f'shape indicates {array.ndim} dimensions.')
         else:
             if shape:
                 raise ValueError('The shape information of 0-dimensional '
-                                 'sequences as %s of element %s can only be '
-                                 '`()`, but `%s` is given.'
-                                 % (self.name, objecttools.devicename(self),
-                                    shape))
+                                 f'sequences as {self.name} of element '
+                                 f'{objecttools.devicename(self)} can only be '
+                                 f'`()`, but `{shape}` is given.')
             else:
                 self.value = 0.
 
@@ -593,12 +947,10 @@ class Sequence(objecttools.ValueMath):
 
     def _raiseitemexception(self):
         if self.values is None:
-            raise RuntimeError('Sequence `%s` has no values so far.'
-                               % self.name)
+            raise RuntimeError(f'Sequence `{self.name}` has no values so far.')
         else:
             objecttools.augmentexcmessage('While trying to item access the '
-                                          'values of sequence `%s`'
-                                          % self.name)
+                                          f'values of sequence `{self.name}`')
 
     def __repr__(self):
         islong = self.length > 255
@@ -620,6 +972,8 @@ class IOSequence(Sequence):
         self._dirpath_int = None
         self._filepath_ext = None
         self._filepath_int = None
+        self._timegridinfo = None
+        self._nmbtimesteps = None
 
     def _getfiletype_ext(self):
         """Ending of the external data file."""
@@ -635,14 +989,13 @@ class IOSequence(Sequence):
                     return pub.sequencemanager.outputfiletype
 
             except AttributeError:
-                raise RuntimeError('For sequence %s of element %s the type '
+                raise RuntimeError(f'For sequence {self.name} of element '
+                                   f'{objecttools.devicename(self)} the type '
                                    'of the external data file cannot be '
                                    'determined.  Either set it manually or '
                                    'embed the sequence object into the HydPy '
                                    'framework in the common manner to allow '
-                                   'for an automatic determination.'
-                                   % (self.name,
-                                      objecttools.devicename(self)))
+                                   'for an automatic determination.')
 
     def _setfiletype_ext(self, name):
         self._filetype_ext = name
@@ -688,13 +1041,12 @@ class IOSequence(Sequence):
                 else:
                     return pub.sequencemanager.outputpath
             except AttributeError:
-                raise RuntimeError('For sequence `%s` the directory of '
-                                   'the external data file cannot be '
+                raise RuntimeError(f'For sequence `{self.name}` the directory '
+                                   'of the external data file cannot be '
                                    'determined.  Either set it manually or '
                                    'embed the sequence object into the HydPy '
                                    'framework in the common manner to allow '
-                                   'for an automatic determination.'
-                                   % self.name)
+                                   'for an automatic determination.')
 
     def _setdirpath_ext(self, name):
         self._dirpath_ext = name
@@ -712,13 +1064,12 @@ class IOSequence(Sequence):
             try:
                 return pub.sequencemanager.temppath
             except AttributeError:
-                raise RuntimeError('For sequence `%s` the directory of '
-                                   'the internal data file cannot be '
+                raise RuntimeError(f'For sequence `{self.name}` the directory '
+                                   'of the internal data file cannot be '
                                    'determined.  Either set it manually or '
                                    'embed the sequence object into the HydPy '
                                    'framework in the common manner to allow '
-                                   'for an automatic determination.'
-                                   % self.name)
+                                   'for an automatic determination.')
 
     def _setdirpath_int(self, name):
         self._dirpath_int = name
@@ -759,42 +1110,55 @@ class IOSequence(Sequence):
                             _delfilepath_int)
 
     def update_fastaccess(self):
-        """"""
+        """Update the information on the internal data handling stored
+        in the `fastaccess` object.
+
+        When the disk flag is activated, the path of the internal data
+        file is resolved once here.  All further accesses to the internal
+        data file rely on this path.
+        """
         if self.diskflag:
             path = self.filepath_int
         else:
             path = None
-        setattr(self.fastaccess, '_%s_path' % self.name, path)
-        length = 1
-        for idx in range(self.NDIM):
-            length *= self.shape[idx]
-            setattr(self.fastaccess, '_%s_length_%d' % (self.name, idx),
-                    self.shape[idx])
-        setattr(self.fastaccess, '_%s_length' % self.name, length)
+        setattr(self.fastaccess, self._members.path, path)
+        self._fa.path = path
+        shape = self.shape
+        if shape != self._fa.lengths:
+            length = 1
+            for (idx, length_) in enumerate(shape):
+                length *= length_
+                setattr(self.fastaccess, f'{self._members.length}_{idx}',
+                        length_)
+            setattr(self.fastaccess, self._members.length, length)
+            self._fa.length = length
+            self._fa.lengths = shape
 
     def _getdiskflag(self):
-        diskflag = getattr(self.fastaccess, '_%s_diskflag' % self.name, None)
+        diskflag = self._fa.diskflag
         if diskflag is not None:
             return diskflag
         else:
-            raise RuntimeError('The `diskflag` of sequence `%s` has '
-                               'not been set yet.' % self.name)
+            raise RuntimeError(f'The `diskflag` of sequence `{self.name}` has '
+                               'not been set yet.')
 
     def _setdiskflag(self, value):
-        setattr(self.fastaccess, '_%s_diskflag' % self.name,  bool(value))
+        setattr(self.fastaccess, self._members.diskflag, bool(value))
+        self._fa.diskflag = bool(value)
 
     diskflag = property(_getdiskflag, _setdiskflag)
 
     def _getramflag(self):
-        ramflag = getattr(self.fastaccess, '_%s_ramflag' % self.name, None)
+        ramflag = self._fa.ramflag
         if ramflag is not None:
             return ramflag
         else:
-            raise RuntimeError('The `ramflag` of sequence `%s` has '
-                               'not been set yet.' % self.name)
+            raise RuntimeError(f'The `ramflag` of sequence `{self.name}` has '
+                               'not been set yet.')
 
     def _setramflag(self, value):
-        setattr(self.fastaccess, '_%s_ramflag' % self.name,  bool(value))
+        setattr(self.fastaccess, self._members.ramflag, bool(value))
+        self._fa.ramflag = bool(value)
 
     ramflag = property(_getramflag, _setramflag)
 
@@ -804,22 +1168,52 @@ class IOSequence(Sequence):
     memoryflag = property(_getmemoryflag)
 
     def _getarray(self):
-        array = getattr(self.fastaccess, '_%s_array' % self.name, None)
+        array = self._fa.array
         if array is not None:
-            return numpy.asarray(array)
+            return array
         else:
-            raise RuntimeError('The `ram array` of sequence `%s` has '
-                               'not been set yet.' % self.name)
+            raise RuntimeError(f'The `ram array` of sequence `{self.name}` '
+                               'has not been set yet.')
 
     def _setarray(self, values):
-        values = numpy.array(values, dtype=float)
-        setattr(self.fastaccess, '_%s_array' % self.name,  values)
+        values = numpy.ascontiguousarray(values, dtype=float)
+        setattr(self.fastaccess, self._members.array, values)
+        self._fa.array = values
 
     def _getseriesshape(self):
-        """Shape of the whole time series (time beeing the first dimension)."""
-        seriesshape = [len(pub.timegrids.init)]
-        seriesshape.extend(self.shape)
-        return tuple(seriesshape)
+        """Shape of the whole time series (time beeing the first dimension).
+
+        The number of time steps is only recalculated when the first
+        date, the last date or the step size of the initialization time
+        grid has changed since the last call.  These values are compared
+        instead of the identities of the respective objects, as
+        :class:`~hydpy.core.timetools.Date` and
+        :class:`~hydpy.core.timetools.Period` objects can be modified
+        in place:
+
+        >>> from hydpy import pub, Timegrid, Timegrids
+        >>> pub.timegrids = Timegrids(Timegrid('2000.01.01',
+        ...                                    '2000.01.04',
+        ...                                    '1d'))
+        >>> from hydpy.core.sequencetools import FluxSequence
+        >>> class Q(FluxSequence):
+        ...     NDIM, NUMERIC = 0, False
+        >>> q = Q()
+        >>> q.seriesshape
+        (3,)
+        >>> date = pub.timegrids.init.lastdate
+        >>> date += '1d'
+        >>> q.seriesshape
+        (4,)
+        """
+        timegrid = pub.timegrids.init
+        timegridinfo = (timegrid.firstdate.datetime,
+                        timegrid.lastdate.datetime,
+                        timegrid.stepsize.timedelta)
+        if timegridinfo != self._timegridinfo:
+            self._timegridinfo = timegridinfo
+            self._nmbtimesteps = len(timegrid)
+        return (self._nmbtimesteps,) + self.shape
 
     seriesshape = property(_getseriesshape)
 
@@ -830,27 +1224,31 @@ class IOSequence(Sequence):
             return self._getarray()
         else:
             raise RuntimeError(
-                'Sequence `%s` of device `%s`is not requested '
-                'to make any internal data available to the user.'
-                % (self.name, objecttools.devicename(self)))
+                f'Sequence `{self.name}` of device '
+                f'`{objecttools.devicename(self)}`is not requested to make '
+                'any internal data available to the user.')
 
     def _setseries(self, values):
-        series = self.series
-        series[:] = values
+        """Write the given values directly into the RAM array or into
+        the internal data file, without loading the old series first."""
         if self.diskflag:
+            series = numpy.empty(self.seriesshape, dtype=float)
+            series[:] = values
             self._save_int(series)
         elif self.ramflag:
-            self._setarray(series)
+            self._getarray()[:] = values
         else:
-            raise RuntimeError('Sequence `%s` is not requested to make any '
-                               'internal data available to the user.'
-                               % self.name)
+            raise RuntimeError(
+                f'Sequence `{self.name}` of device '
+                f'`{objecttools.devicename(self)}` is not requested to make '
+                'any internal data available to the user.')
 
     def _delseries(self):
         if self.diskflag:
-            os.remove(self.filepath_int)
+            os.remove(self._fa.path or self.filepath_int)
         elif self.ramflag:
-            setattr(self.fastaccess, '_%s_array' % self.name, None)
+            setattr(self.fastaccess, self._members.array, None)
+            self._fa.array = None
 
     series = property(_getseries, _setseries, _delseries)
 
@@ -862,42 +1260,43 @@ class IOSequence(Sequence):
             timegrid_data, values = self._load_npy()
         else:
             timegrid_data, values = self._load_asc()
+        init = pub.timegrids.init
         if self.shape != values.shape[1:]:
             raise RuntimeError(
-                'The shape of sequence `%s` of element `%s` is `%s`, but '
-                'according to the external data file `%s` it should be `%s`.'
-                % (self.name, objecttools.devicename(self), self.shape,
-                   self.filepath_ext, values.shape[1:]))
-        if pub.timegrids.init.stepsize != timegrid_data.stepsize:
+                f'The shape of sequence `{self.name}` of element '
+                f'`{objecttools.devicename(self)}` is `{self.shape}`, but '
+                f'according to the external data file `{self.filepath_ext}` '
+                f'it should be `{values.shape[1:]}`.')
+        if init.stepsize != timegrid_data.stepsize:
             raise RuntimeError(
-                'According to external data file `%s`, the date time step '
-                'of sequence `%s` of element `%s` is `%s`, but the actual '
-                'simulation time step is `%s`.'
-                % (self.filepath_ext, self.name, objecttools.devicename(self),
-                   timegrid_data.stepsize, pub.timegrids.init.stepsize))
-        elif pub.timegrids.init not in timegrid_data:
+                f'According to external data file `{self.filepath_ext}`, the '
+                f'date time step of sequence `{self.name}` of element '
+                f'`{objecttools.devicename(self)}` is '
+                f'`{timegrid_data.stepsize}`, but the actual simulation time '
+                f'step is `{init.stepsize}`.')
+        elif init not in timegrid_data:
             if pub.options.checkseries:
                 raise RuntimeError(
-                    'For sequence `%s` of element `%s` the initialization '
-                    'time grid (%s) does not define a subset of the time '
-                    'grid of the external data file %s (%s).'
-                    % (self.name, objecttools.devicename(self),
-                       pub.timegrids.init, self.filepath_ext, timegrid_data))
+                    f'For sequence `{self.name}` of element '
+                    f'`{objecttools.devicename(self)}` the initialization '
+                    f'time grid ({init}) does not define a subset of the '
+                    'time grid of the external data file '
+                    f'{self.filepath_ext} ({timegrid_data}).')
             else:
                 values = self.adjust_short_series(timegrid_data, values)
         else:
-            idx1 = timegrid_data[pub.timegrids.init.firstdate]
-            idx2 = timegrid_data[pub.timegrids.init.lastdate]
+            (idx1, idx2) = timegrid_data.indices(init.firstdate,
+                                                 init.lastdate)
             values = values[idx1:idx2]
         if self.diskflag:
             self._save_int(values)
         elif self.ramflag:
-            self._setarray(values)
+            self._setarray(numpy.array(values, dtype=float))
         else:
             raise RuntimeError(
-                'Sequence `%s` of element `%s`is not requested to make '
-                'any internal data available the the user.'
-                % (self.name, objecttools.devicename(self)))
+                f'Sequence `{self.name}` of element '
+                f'`{objecttools.devicename(self)}`is not requested to make '
+                'any internal data available the the user.')
 
     def adjust_short_series(self, timegrid, values):
         """Adjust a short time series to a longer timegrid.
@@ -971,27 +1370,27 @@ class IOSequence(Sequence):
 
         >>> pub.options.usedefaultvalues = False
         """
-        idxs = [timegrid[pub.timegrids.init.firstdate],
-                timegrid[pub.timegrids.init.lastdate]]
+        init = pub.timegrids.init
+        (idx1, idx2) = timegrid.indices(init.firstdate, init.lastdate)
         valcopy = values
-        values = numpy.full(self.seriesshape, self.initvalue)
+        values = numpy.empty(self.seriesshape)
+        values.fill(self.initvalue)
         len_ = len(valcopy)
-        jdxs = []
-        for idx in idxs:
-            if idx < 0:
-                jdxs.append(0)
-            elif idx <= len_:
-                jdxs.append(idx)
-            else:
-                jdxs.append(len_)
-        valcopy = valcopy[jdxs[0]:jdxs[1]]
-        zdx1 = max(-idxs[0], 0)
-        zdx2 = zdx1+jdxs[1]-jdxs[0]
-        values[zdx1:zdx2] = valcopy
+        jdx1 = min(max(idx1, 0), len_)
+        jdx2 = min(max(idx2, 0), len_)
+        zdx1 = max(-idx1, 0)
+        zdx2 = zdx1+jdx2-jdx1
+        values[zdx1:zdx2] = valcopy[jdx1:jdx2]
         return values
 
     def save_ext(self):
-        """Write the internal data into an external data file."""
+        """Write the internal data into an external data file.
+
+        Binary `npy` files, the default file type of class
+        :class:`~hydpy.core.filetools.SequenceManager`, are much faster to
+        write and read than text files, which should only be selected when
+        human readability is required.
+        """
         if self.filetype_ext == 'npy':
             series = pub.timegrids.init.array2series(self.series)
             numpy.save(self.filepath_ext, series)
@@ -1003,62 +1402,79 @@ class IOSequence(Sequence):
     def _load_npy(self):
         """Return the data timegrid and the complete external data from a
         binary numpy file.
+
+        The file is memory mapped, so that only the data actually required
+        by :meth:`~IOSequence.load_ext` is read from disk.
         """
+        filepath = self.filepath_ext
         try:
-            data = numpy.load(self.filepath_ext)
+            data = numpy.load(filepath, mmap_mode='r')
         except BaseException:
             prefix = ('While trying to load the external data of sequence '
-                      '`%s` from file `%s`' % (self.name, self.filepath_ext))
+                      f'`{self.name}` from file `{filepath}`')
             objecttools.augmentexcmessage(prefix)
         try:
             timegrid_data = timetools.Timegrid.fromarray(data)
         except BaseException:
             prefix = ('While trying to retrieve the data timegrid of the '
-                      'external data file `%s` of sequence `%s`'
-                      % (self.filepath_ext, self.name))
+                      f'external data file `{filepath}` of sequence '
+                      f'`{self.name}`')
             objecttools.augmentexcmessage(prefix)
         return timegrid_data, data[13:]
 
     def _load_asc(self):
+        """Return the data timegrid and the complete external data from a
+        text file.  Both are read through the same file handle.
+        """
         with open(self.filepath_ext) as file_:
             header = '\n'.join([file_.readline() for idx in range(3)])
-        timegrid_data = eval(header, {}, {'Timegrid': timetools.Timegrid})
-        values = numpy.loadtxt(self.filepath_ext, skiprows=3,
-                               ndmin=self.NDIM+1)
+            timegrid_data = eval(header, {}, {'Timegrid': timetools.Timegrid})
+            values = numpy.loadtxt(file_, ndmin=self.NDIM+1)
         return timegrid_data, values
 
     def _load_int(self):
         """Load internal data from file and return it."""
-        values = numpy.fromfile(self.filepath_int)
+        values = numpy.fromfile(self._fa.path or self.filepath_int,
+                                dtype=float)
         if self.NDIM > 0:
-            values = values.reshape(self.seriesshape)
+            values.shape = self.seriesshape
         return values
 
     def zero_int(self):
-        """Initialize the internal data series with zero values."""
-        values = numpy.zeros(self.seriesshape)
+        """Initialize the internal data series with zero values.
+
+        An already available RAM array of the required shape is reused
+        instead of allocating a new one.
+        """
+        seriesshape = self.seriesshape
         if self.diskflag:
-            self._save_int(values)
+            self._save_int(numpy.zeros(seriesshape))
         elif self.ramflag:
-            self._setarray(values)
+            array = self._fa.array
+            if (array is not None) and (array.shape == seriesshape):
+                array.fill(0.)
+            else:
+                self._setarray(numpy.zeros(seriesshape))
         else:
-            raise RuntimeError('Sequence `%s` is not requested to make any '
-                               'internal data available to the user.'
-                               % self.name)
+            raise RuntimeError(f'Sequence `{self.name}` is not requested to '
+                               'make any internal data available to the user.')
 
     def _save_int(self, values):
-        values.tofile(self.filepath_int)
+        """Write the given internal data to file.  Arrays that are already
+        C-contiguous and of type float are written without copying."""
+        values = numpy.ascontiguousarray(values, dtype=float)
+        values.tofile(self._fa.path or self.filepath_int)
 
     def activate_disk(self):
         """Demand reading/writing internal data from/to hard disk."""
         self.deactivate_ram()
         self.diskflag = True
+        self.update_fastaccess()
         if (isinstance(self, InputSequence) or
            (isinstance(self, NodeSequence) and self.use_ext)):
             self.load_ext()
         else:
             self.zero_int()
-        self.update_fastaccess()
 
     def deactivate_disk(self):
         """Prevent from reading/writing internal data from/to hard disk."""
@@ -1084,7 +1500,11 @@ class IOSequence(Sequence):
             self.ramflag = False
 
     def disk2ram(self):
-        """Move internal data from disk to RAM."""
+        """Move internal data from disk to RAM.
+
+        The data is read from file once and the resulting array is used
+        as the RAM array directly, without copying it.
+        """
         values = self.series
         self.deactivate_disk()
         self.ramflag = True
@@ -1092,12 +1512,15 @@ class IOSequence(Sequence):
         self.update_fastaccess()
 
     def ram2disk(self):
-        """Move internal data from RAM to disk."""
+        """Move internal data from RAM to disk.
+
+        The RAM array is written to file once, without copying it before.
+        """
         values = self.series
         self.deactivate_ram()
         self.diskflag = True
-        self._save_int(values)
         self.update_fastaccess()
+        self._save_int(values)
 
     def _setshape(self, shape):
         Sequence._setshape(self, shape)
@@ -1114,17 +1537,16 @@ class ModelIOSequence(IOSequence):
             return self._rawfilename
         else:
             try:
-                return '%s_%s_%s' % (
-                       self.subseqs.seqs.model.element.name,
-                       objecttools.classname(self.subseqs)[:-9].lower(),
-                       self.name)
+                element = self.subseqs.seqs.model.element.name
+                subseqs = objecttools.classname(self.subseqs)[:-9].lower()
+                return f'{element}_{subseqs}_{self.name}'
             except AttributeError:
-                raise RuntimeError('For sequence `%s` the raw filename cannot '
-                                   'determined.  Either set it manually or '
-                                   'embed the sequence object into the HydPy '
-                                   'framework in the common manner to allow '
-                                   'for an automatic determination.'
-                                   % self.name)
+                raise RuntimeError(f'For sequence `{self.name}` the raw '
+                                   'filename cannot determined.  Either set '
+                                   'it manually or embed the sequence object '
+                                   'into the HydPy framework in the common '
+                                   'manner to allow for an automatic '
+                                   'determination.')
 
     def _setrawfilename(self, name):
         self._rawfilename = str(name)
@@ -1181,11 +1603,11 @@ class ConditionSequence(object):
     trim = objecttools.trim
 
     def warntrim(self):
-        warnings.warn('For sequence %s of element %s at least one value '
+        warnings.warn(f'For sequence {self.name} of element '
+                      f'{objecttools.devicename(self)} at least one value '
                       'needed to be trimmed.  One possible reason could be '
                       'that the related control parameter and initial '
-                      'condition files are inconsistent.'
-                      % (self.name, objecttools.devicename(self)))
+                      'condition files are inconsistent.')
 
     def reset(self):
         if self._oldargs:
@@ -1209,6 +1631,8 @@ class StateSequence(ModelIOSequence, ConditionSequence):
         self.new2old()
 
     def connect(self, subseqs):
+        if subseqs is self.subseqs:
+            return
         ModelIOSequence.connect(self, subseqs)
         self.fastaccess_old = subseqs.fastaccess_old
         self.fastaccess_new = subseqs.fastaccess_new
@@ -1218,9 +1642,18 @@ class StateSequence(ModelIOSequence, ConditionSequence):
             setattr(self.fastaccess_old, self.name, 0.)
 
     def _setshape(self, shape):
+        if self.subseqs is not None:
+            self.subseqs._unblock(self.name)
         ModelIOSequence._setshape(self, shape)
         if self.NDIM:
-            setattr(self.fastaccess_old, self.name, self.new.copy())
+            new = self.new
+            old = getattr(self.fastaccess_old, self.name, None)
+            if old is not None:
+                old = numpy.asarray(old)
+                if old.shape == new.shape:
+                    old[:] = new
+                    return
+            setattr(self.fastaccess_old, self.name, new.copy())
 
     shape = property(ModelIOSequence._getshape, _setshape)
 
@@ -1239,8 +1672,8 @@ class StateSequence(ModelIOSequence, ConditionSequence):
         """
         value = getattr(self.fastaccess_old, self.name, None)
         if value is None:
-            raise RuntimeError('No value/values of sequence `%s` has/have '
-                               'not been defined so far.' % self.name)
+            raise RuntimeError(f'No value/values of sequence `{self.name}` '
+                               'has/have not been defined so far.')
         else:
             if self.NDIM:
                 value = numpy.asarray(value)
@@ -1251,9 +1684,9 @@ class StateSequence(ModelIOSequence, ConditionSequence):
             try:
                 temp = value[0]
                 if len(value) > 1:
-                    raise ValueError('%d values are assigned to the scalar '
-                                     'sequence `%s`, which is ambiguous.'
-                                     % (len(value)), self.name)
+                    raise ValueError(f'{len(value)} values are assigned to '
+                                     f'the scalar sequence `{self.name}`, '
+                                     'which is ambiguous.')
                 value = temp
             except (TypeError, IndexError):
                 pass
@@ -1261,8 +1694,8 @@ class StateSequence(ModelIOSequence, ConditionSequence):
                 value = float(value)
             except (ValueError, TypeError):
                 raise TypeError('When trying to set the value of sequence '
-                                '`%s`, it was not possible to convert `%s` '
-                                'to float .' % (self.name, value))
+                                f'`{self.name}`, it was not possible to '
+                                f'convert `{value}` to float .')
         else:
             try:
                 value = value.value
@@ -1271,19 +1704,33 @@ class StateSequence(ModelIOSequence, ConditionSequence):
             try:
                 value = numpy.full(self.shape, value, dtype=float)
             except ValueError:
-                raise ValueError('The values `%s` cannot be converted to a '
-                                 'numpy ndarray with shape %s containing '
-                                 'entries of type float.'
-                                 % (value, self.shape))
+                raise ValueError(f'The values `{value}` cannot be converted '
+                                 f'to a numpy ndarray with shape {self.shape} '
+                                 'containing entries of type float.')
+            old = getattr(self.fastaccess_old, self.name, None)
+            if old is not None:
+                old = numpy.asarray(old)
+                if old.shape == value.shape:
+                    old[:] = value
+                    return
+            if self.subseqs is not None:
+                self.subseqs._unblock(self.name)
         setattr(self.fastaccess_old, self.name, value)
 
     old = property(_getold, _setold)
 
     def new2old(self):
+        """Assign the new state value(s) to the old state value(s).
+
+        Scalar values are passed between the `fastaccess` objects
+        directly, without passing the type checks of property
+        :attr:`~StateSequence.old`.
+        """
         if self.NDIM:
-            self.old[:] = self.new[:]
+            numpy.copyto(self.old, self.new)
         else:
-            self.old = self.new
+            setattr(self.fastaccess_old, self.name,
+                    getattr(self.fastaccess_new, self.name))
 
 
 class LogSequence(Sequence, ConditionSequence):
@@ -1346,6 +1793,12 @@ class LinkSequence(Sequence):
 
     value = property(_getvalue, _setvalue)
     values = value
+    """Synonym of :attr:`~Sequence.value`.  Note that new values of
+    multidimensional sequences are written into the already existing
+    array instead of replacing it.  Hence, arrays previously queried via
+    :attr:`~Sequence.values` reflect all later assignments.  Use their
+    :meth:`~numpy.ndarray.copy` method to keep the current values.
+    """
 
     def _getshape(self):
         if self.NDIM == 0:
@@ -1354,7 +1807,8 @@ class LinkSequence(Sequence):
             try:
                 return getattr(self.fastaccess, self.name).shape
             except AttributeError:
-                return (getattr(self.fastaccess, '_%s_length_0' % self.name), )
+                length = f'{self._members.length}_0'
+                return (getattr(self.fastaccess, length),)
 
     def _setshape(self, shape):
         if self.NDIM == 1:
@@ -1368,6 +1822,13 @@ class LinkSequence(Sequence):
     shape = property(_getshape, _setshape)
 
 
+_BLOCKSHAPESETTERS = frozenset((Sequence._setshape,
+                                IOSequence._setshape,
+                                StateSequence._setshape))
+"""Shape setters allowing :meth:`SubSequences.setshapes` to store the
+values of the respective sequences in a common block."""
+
+
 class NodeSequence(IOSequence):
 
     def _getrawfilename(self):
@@ -1376,17 +1837,15 @@ class NodeSequence(IOSequence):
             return self._rawfilename
         else:
             try:
-                return '%s_%s_%s' % (
-                       self.subseqs.node.name,
-                       self.name,
-                       self.subseqs.node.variable.lower())
+                node = self.subseqs.node
+                return f'{node.name}_{self.name}_{node.variable.lower()}'
             except AttributeError:
-                raise RuntimeError('For sequence `%s` the raw filename cannot '
-                                   'determined.  Either set it manually or '
-                                   'embed the sequence object into the HydPy '
-                                   'framework in the common manner to allow '
-                                   'for an automatic determination.'
-                                   % self.name)
+                raise RuntimeError(f'For sequence `{self.name}` the raw '
+                                   'filename cannot determined.  Either set '
+                                   'it manually or embed the sequence object '
+                                   'into the HydPy framework in the common '
+                                   'manner to allow for an automatic '
+                                   'determination.')
 
     def _setrawfilename(self, name):
         self._rawfilename = str(name)
@@ -1432,9 +1891,9 @@ class Sim(NodeSequence):
             self.diskflag = False
             if pub.options.warnmissingsimfile:
                 warnings.warn('The option `diskflag` of the simulation '
-                              'sequence `%s` had to be set to `False` due '
-                              'to the following problem: %s.'
-                              % (objecttools.devicename(self), message))
+                              f'sequence `{objecttools.devicename(self)}` had '
+                              'to be set to `False` due to the following '
+                              f'problem: {message}.')
 
     def activate_ram(self):
         try:
@@ -1444,9 +1903,9 @@ class Sim(NodeSequence):
             self.ramflag = False
             if pub.options.warnmissingsimfile:
                 warnings.warn('The option `ramflag` of the simulation '
-                              'sequence `%s` had to be set to `False` due '
-                              'to the following problem: %s.'
-                              % (objecttools.devicename(self), message))
+                              f'sequence `{objecttools.devicename(self)}` had '
+                              'to be set to `False` due to the following '
+                              f'problem: {message}.')
 
 
 class Obs(NodeSequence):
@@ -1464,9 +1923,9 @@ class Obs(NodeSequence):
             self.diskflag = False
             if pub.options.warnmissingobsfile:
                 warnings.warn('The option `diskflag` of the observation '
-                              'sequence `%s` had to be set to `False` due '
-                              'to the following problem: %s.'
-                              % (objecttools.devicename(self), message))
+                              f'sequence `{objecttools.devicename(self)}` had '
+                              'to be set to `False` due to the following '
+                              f'problem: {message}.')
 
     def activate_ram(self):
         try:
@@ -1476,18 +1935,29 @@ class Obs(NodeSequence):
             self.ramflag = False
             if pub.options.warnmissingobsfile:
                 warnings.warn('The option `ramflag` of the observation '
-                              'sequence `%s` had to be set to `False` due '
-                              'to the following problem: %s.'
-                              % (objecttools.devicename(self), message))
+                              f'sequence `{objecttools.devicename(self)}` had '
+                              'to be set to `False` due to the following '
+                              f'problem: {message}.')
 
     @property
     def series_complete(self):
-        return self.memoryflag and not numpy.any(numpy.isnan(self.series))
+        """True, if the internal data is available and does not contain
+        any missing (nan) values.
+
+        As :func:`numpy.min` propagates nan values, taking the minimum
+        detects missing values without allocating an intermediate boolean
+        array of the length of the series.
+        """
+        if not self.memoryflag:
+            return False
+        series = self.series
+        return (series.size == 0) or not numpy.isnan(numpy.min(series))
 
 
 class NodeSequences(IOSubSequences):
     """Base class for handling node sequences."""
     _SEQCLASSES = (Sim, Obs)
+    _HOOKS = IOSubSequences._HOOKS.union(('loaddata', 'savedata'))
 
     def __init__(self, seqs, cls_fastaccess=None):
         IOSubSequences.__init__(self, seqs, cls_fastaccess)
@@ -1500,6 +1970,51 @@ class NodeSequences(IOSubSequences):
         self.fastaccess.savedata(idx)
 
 
+_MemberNames = collections.namedtuple(
+    '_MemberNames',
+    ('ndim', 'length', 'diskflag', 'ramflag', 'path', 'file', 'array'))
+
+
+@functools.lru_cache(maxsize=None)
+def _membernames(name):
+    """Return the names of the members of :class:`FastAccess` objects
+    handling the metadata of the sequence with the given name.
+
+    >>> from hydpy.core.sequencetools import _membernames
+    >>> _membernames('seq1').diskflag
+    '_seq1_diskflag'
+    """
+    return _MemberNames(*(f'_{name}_{suffix}'
+                          for suffix in _MemberNames._fields))
+
+
+_executor = None
+"""Tuple containing the number of worker threads and the
+:class:`~concurrent.futures.ThreadPoolExecutor` returned by the last
+call to :func:`_getexecutor`."""
+
+
+def _getexecutor(nmbthreads):
+    """Return a :class:`~concurrent.futures.ThreadPoolExecutor` with the
+    given number of worker threads.
+
+    The executor is reused until another number of threads is requested:
+
+    >>> from hydpy.core.sequencetools import _getexecutor
+    >>> _getexecutor(2) is _getexecutor(2)
+    True
+    >>> _getexecutor(3) is _getexecutor(2)
+    False
+    """
+    global _executor
+    if (_executor is None) or (_executor[0] != nmbthreads):
+        if _executor is not None:
+            _executor[1].shutdown(wait=False)
+        _executor = (nmbthreads,
+                     concurrent.futures.ThreadPoolExecutor(nmbthreads))
+    return _executor[1]
+
+
 class FastAccess(object):
     """Provides fast access to the values of the sequences of a sequence
     subgroup and supports the handling of internal data series during
@@ -1518,10 +2033,16 @@ class FastAccess(object):
       * _seq1_ndim (:class:`int`): Number of dimensions.
       * _seq1_length_0 (:class:`int`): Length in the first dimension.
       * _seq1_length_1 (:class:`int`): Length in the second dimension.
+      * _seq1_length (:class:`int`): Total number of values.
       * _seq1_ramflag (:class:`bool`): Handle internal data in RAM?
       * _seq1_diskflag (:class:`bool`): Handle internal data on disk?
       * _seq1_path (:class:`str`): Path of the internal data file.
-      * _seq1_file (:class:`file`): Object handling the internal data file.
+      * _seq1_file (:class:`~numpy.memmap`): Memory map of the internal
+        data file (only while the files are opened).
+
+    Additionally, the tuple `_names` keeps the names of all registered
+    sequences in the order of their registration, which saves searching
+    through the instance dictionary on each iteration.
 
     Note that all these dynamical attributes and the following methods are
     initialised, changed or applied by the respective :class:`SubSequences`
@@ -1529,86 +2050,124 @@ class FastAccess(object):
     and thus not recommended.
     """
 
+    def __init__(self):
+        self._names = ()
+
+    def registername(self, name):
+        """Register the name of a (newly connected) sequence.
+
+        >>> from hydpy.core.sequencetools import FastAccess
+        >>> fastaccess = FastAccess()
+        >>> fastaccess.registername('seq1')
+        >>> fastaccess.registername('seq2')
+        >>> fastaccess.registername('seq1')
+        >>> tuple(fastaccess)
+        ('seq1', 'seq2')
+        """
+        if name not in self._names:
+            self._names += (name,)
+
     def openfiles(self, idx):
-        """Open all files with an activated disk flag."""
+        """Map all files with an activated disk flag into memory.
+
+        The time step index is not required, as :meth:`~FastAccess.loaddata`
+        and :meth:`~FastAccess.savedata` access the mapped files via the
+        index passed to them.
+
+        :func:`numpy.memmap` refuses to map empty files, which result
+        from sequences with a zero-length shape.  Such sequences are
+        handled by an empty array instead:
+
+        >>> import tempfile
+        >>> from hydpy import pub, Timegrid, Timegrids
+        >>> pub.timegrids = Timegrids(Timegrid('2000.01.01',
+        ...                                    '2000.01.04',
+        ...                                    '1d'))
+        >>> from hydpy.core.sequencetools import FluxSequence, FluxSequences
+        >>> class Q(FluxSequence):
+        ...     NDIM, NUMERIC = 1, False
+        >>> class Fluxes(FluxSequences):
+        ...     _SEQCLASSES = (Q,)
+        >>> fluxes = Fluxes(None)
+        >>> fluxes.q.shape = 0
+        >>> fluxes.q.dirpath_int = tempfile.mkdtemp()
+        >>> fluxes.q.rawfilename = 'q'
+        >>> fluxes.q.activate_disk()
+        >>> fluxes.openfiles(0)
+        >>> fluxes.fastaccess._q_file.shape
+        (0,)
+        >>> for idx in range(3):
+        ...     fluxes.savedata(idx)
+        >>> fluxes.closefiles()
+        >>> fluxes.q.series.shape
+        (3, 0)
+
+        See method :meth:`~hydpy.core.hydpytools.HydPy.doit` for a
+        complete simulation run based on memory mapped files.
+        """
         for name in self:
-            if getattr(self, '_%s_diskflag' % name):
-                path = getattr(self, '_%s_path' % name)
-                file_ = open(path, 'rb+')
-                ndim = getattr(self, '_%s_ndim' % name)
-                position = 8*idx
-                for idim in range(ndim):
-                    length = getattr(self, '_%s_length_%d' % (name, idim))
-                    position *= length
-                file_.seek(position)
-                setattr(self, '_%s_file' % name, file_)
+            members = _membernames(name)
+            if getattr(self, members.diskflag):
+                path = getattr(self, members.path)
+                if os.path.getsize(path):
+                    file_ = numpy.memmap(path, dtype=float, mode='r+')
+                else:
+                    file_ = numpy.empty(0)
+                setattr(self, members.file, file_)
 
     def closefiles(self):
-        """Close all files with an activated disk flag."""
+        """Flush and release all memory mapped files with an activated
+        disk flag."""
         for name in self:
-            if getattr(self, '_%s_diskflag' % name):
-                file_ = getattr(self, '_%s_file' % name)
-                file_.close()
+            members = _membernames(name)
+            if getattr(self, members.diskflag):
+                file_ = getattr(self, members.file)
+                if isinstance(file_, numpy.memmap):
+                    file_.flush()
+                setattr(self, members.file, '')
 
     def loaddata(self, idx):
         """Load the internal data of all sequences.  Load from file if the
         corresponding disk flag is activated, otherwise load from RAM."""
         for name in self:
-            ndim = getattr(self, '_%s_ndim' % name)
-            diskflag = getattr(self, '_%s_diskflag' % name)
-            ramflag = getattr(self, '_%s_ramflag' % name)
-            if diskflag:
-                file_ = getattr(self, '_%s_file' % name)
-                length_tot = 1
-                shape = []
-                for idx in range(ndim):
-                    length = getattr(self, '_%s_length_%s' % (name, idx))
-                    length_tot *= length
-                    shape.append(length)
-                raw = file_.read(length_tot*8)
-                values = struct.unpack(length_tot*'d', raw)
-                if ndim:
-                    values = numpy.array(values).reshape(shape)
-                else:
-                    values = values[0]
-            elif ramflag:
-                array = getattr(self, '_%s_array' % name)
-                values = array[idx]
-            if (diskflag or ramflag):
-                if ndim == 0:
-                    setattr(self, name, values)
+            members = _membernames(name)
+            if getattr(self, members.diskflag):
+                file_ = getattr(self, members.file)
+                if getattr(self, members.ndim):
+                    array = getattr(self, name)
+                    length = getattr(self, members.length)
+                    jdx = idx*length
+                    array[...] = file_[jdx:jdx+length].reshape(array.shape)
                 else:
+                    setattr(self, name, file_[idx])
+            elif getattr(self, members.ramflag):
+                values = getattr(self, members.array)[idx]
+                if getattr(self, members.ndim):
                     getattr(self, name)[:] = values
+                else:
+                    setattr(self, name, values)
 
     def savedata(self, idx):
         """Save the internal data of all sequences with an activated flag.
         Write to file if the corresponding disk flag is activated; store
         in working memory if the corresponding ram flag is activated."""
         for name in self:
+            members = _membernames(name)
             actual = getattr(self, name)
-            diskflag = getattr(self, '_%s_diskflag' % name)
-            ramflag = getattr(self, '_%s_ramflag' % name)
-            if diskflag:
-                file_ = getattr(self, '_%s_file' % name)
-                ndim = getattr(self, '_%s_ndim' % name)
-                length_tot = 1
-                for idx in range(ndim):
-                    length = getattr(self, '_%s_length_%s' % (name, idx))
-                    length_tot *= length
-                if ndim:
-                    raw = struct.pack(length_tot*'d', *actual.flatten())
+            if getattr(self, members.diskflag):
+                file_ = getattr(self, members.file)
+                if getattr(self, members.ndim):
+                    length = getattr(self, members.length)
+                    jdx = idx*length
+                    file_[jdx:jdx+length] = numpy.ravel(actual)
                 else:
-                    raw = struct.pack('d', actual)
-                file_.write(raw)
-            elif ramflag:
-                array = getattr(self, '_%s_array' % name)
-                array[idx] = actual
+                    file_[idx] = actual
+            elif getattr(self, members.ramflag):
+                getattr(self, members.array)[idx] = actual
 
     def __iter__(self):
-        """Iterate over all sequence names."""
-        for key in vars(self).keys():
-            if not key.startswith('_'):
-                yield key
+        """Iterate over all registered sequence names."""
+        return iter(self._names)
 
 
 autodoctools.autodoc_module()
@@ -999,16 +999,57 @@ class Timegrid(object):
         return int((self.lastdate-self.firstdate) / self.stepsize)
 
     def __getitem__(self, key):
+        """Return the date of the given index or the index of the given
+        date.
+
+        >>> from hydpy.core.timetools import Timegrid
+        >>> timegrid = Timegrid('2000.01.01', '2000.01.10', '1d')
+        >>> print(timegrid[2])
+        2000.01.03 00:00:00
+        >>> timegrid['2000.01.03']
+        2
+
+        Use method :meth:`~Timegrid.indices` for querying the indices of
+        multiple dates at once.
+        """
         if isinstance(key, int):
             return Date(self.firstdate + key*self.stepsize)
         else:
-            key = Date(key)
-            index = (key-self.firstdate) / self.stepsize
-            if index % 1.:
-                raise ValueError('The given date `%s` is not properly '
-                                 'alligned on the indexed timegrid.' % key)
-            else:
-                return int(index)
+            if not isinstance(key, Date):
+                key = Date(key)
+            return self._toindex((key-self.firstdate) / self.stepsize, key)
+
+    def indices(self, *dates):
+        """Return the indices of all given dates at once, querying the
+        first date and the step size of the :class:`Timegrid` object
+        only once.
+
+        >>> from hydpy.core.timetools import Timegrid
+        >>> timegrid = Timegrid('2000.01.01', '2000.01.10', '1d')
+        >>> timegrid.indices('2000.01.03', '2000.01.10', '1999.12.30')
+        (2, 9, -2)
+        >>> timegrid.indices('2000.01.03 12:00')
+        Traceback (most recent call last):
+        ...
+        ValueError: The given date `2000.01.03 12:00:00` is not properly alligned on the indexed timegrid.
+        """
+        firstdate = self.firstdate
+        stepsize = self.stepsize
+        indices = []
+        for date in dates:
+            if not isinstance(date, Date):
+                date = Date(date)
+            indices.append(self._toindex((date-firstdate) / stepsize, date))
+        return tuple(indices)
+
+    @staticmethod
+    def _toindex(index, date):
+        """Return the given float index as an integer, if the given date
+        is properly aligned on the timegrid."""
+        if index % 1.:
+            raise ValueError('The given date `%s` is not properly '
+                             'alligned on the indexed timegrid.' % date)
+        return int(index)
 
     def __iter__(self):
         date = self.firstdate.copy()
@@ -5,11 +5,14 @@
 from __future__ import division, print_function
 import os
 import sys
+import re
+import ast
 import platform
 import shutil
 import copy
 import inspect
 import importlib
+import textwrap
 import distutils.core
 import distutils.extension
 import Cython.Build
@@ -145,7 +148,8 @@ class Cythonizer(object):
     @property
     def pysourcefiles(self):
         """All source files of the actual models Python classes and their
-        respective base classes."""
+        respective base classes, as well as of the methods of the model
+        class, which might be defined in other modules."""
         sourcefiles = set()
         for (name, child) in vars(self).items():
             try:
@@ -158,6 +162,9 @@ class Cythonizer(object):
                 except TypeError:
                     break
                 sourcefiles.add(sourcefile)
+            for tuplename in ('_RUNMETHODS', '_ADDMETHODS'):
+                for method in getattr(child, tuplename, ()):
+                    sourcefiles.add(inspect.getfile(method))
         return Lines(*sourcefiles)
 
     @property
@@ -708,6 +715,62 @@ class FuncConverter(object):
         return [name for name in self.untypedvarnames if
                 name not in self.untypedarguments]
 
+    @property
+    def tree(self):
+        """Abstract syntax tree of the method."""
+        return ast.parse(textwrap.dedent(inspect.getsource(self.func)))
+
+    @property
+    def floatnames(self):
+        """Names of all local variables explicitly declared as `float`.
+
+        A local variable is declared as `float` by annotating its first
+        assignment, e.g. `qma: float = 0.`.  All other local variables
+        are of type `int`.  A `float` variable must not serve as an index:
+
+        >>> from hydpy.cythons.modelutils import FuncConverter
+        >>> def calc_test(self):
+        ...     flu = self.sequences.fluxes.fastaccess
+        ...     for idx in range(3):
+        ...         jdx: float = 2.
+        ...         flu.q[idx] = flu.q[jdx]
+        >>> FuncConverter(None, 'calc_test', calc_test).floatnames
+        Traceback (most recent call last):
+        ...
+        TypeError: Local variable `jdx` of method `calc_test` is declared \
+as `float` but is used as an index.
+        """
+        tree = self.tree
+        names = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.AnnAssign):
+                annotation = getattr(node.annotation, 'id', None)
+                if ((not isinstance(node.target, ast.Name)) or
+                        (annotation not in ('float', 'int'))):
+                    raise NotImplementedError(
+                        f'Method `{self.funcname}` contains the annotation '
+                        f'`{self.sourcelines[node.lineno-1].strip()}`.  '
+                        'Only local variables can be annotated and the '
+                        'only supported types are `float` and `int`.')
+                if annotation == 'float':
+                    names.append(node.target.id)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Subscript):
+                index = node.slice
+                if sys.version_info < (3, 9):
+                    index = getattr(index, 'value', index)
+                if isinstance(index, ast.Tuple):
+                    indices = index.elts
+                else:
+                    indices = [index]
+                for index in indices:
+                    if isinstance(index, ast.Name) and (index.id in names):
+                        raise TypeError(
+                            f'Local variable `{index.id}` of method '
+                            f'`{self.funcname}` is declared as `float` '
+                            'but is used as an index.')
+        return names
+
     @property
     def cleanlines(self):
         """Cleaned code lines.
@@ -743,16 +806,47 @@ class FuncConverter(object):
           * Method shall be inlined
           * Method returns nothing
           * Method arguments are of type `int` (except self)
-          * Local variables are of type `int`
+          * Local variables are of type `int`, except those declared
+            as `float` (see :attr:`~FuncConverter.floatnames`)
+
+        The first example shows that the name of a local variable does
+        not affect its type.  Only the explicit `float` annotation does,
+        which is removed from the Cython code:
+
+        >>> from hydpy.cythons.modelutils import FuncConverter
+        >>> def calc_test(self):
+        ...     flu = self.sequences.fluxes.fastaccess
+        ...     for d_idx in range(3):
+        ...         d_q: float = 0.
+        ...         d_q += flu.q[d_idx]
+        >>> from types import SimpleNamespace
+        >>> model = SimpleNamespace(parameters=(),
+        ...                         sequences=(('fluxes', None),))
+        >>> FuncConverter(model, 'calc_test', calc_test).pyxlines
+            cpdef inline void calc_test(self):
+                cdef int d_idx
+                cdef double d_q
+                for d_idx in range(3):
+                    d_q = 0.
+                    d_q += self.fluxes.q[d_idx]
+        <BLANKLINE>
         """
         lines = ['    '+line for line in self.cleanlines]
         lines[0] = lines[0].replace('def ', 'cpdef inline void ')
         for name in self.untypedarguments:
             lines[0] = lines[0].replace(', %s ' % name, ', int %s ' % name)
             lines[0] = lines[0].replace(', %s)' % name, ', int %s)' % name)
-        if self.untypedinternalvarnames:
-            lines.insert(1, '        cdef int ' +
-                            ', '.join(self.untypedinternalvarnames))
+        floatnames = self.floatnames
+        lines = [re.sub(r'^(\s*\w+)\s*:\s*(float|int)\s*=', r'\1 =', line)
+                 for line in lines]
+        doublenames = [name for name in self.untypedinternalvarnames
+                       if name in floatnames]
+        intnames = [name for name in self.untypedinternalvarnames
+                    if name not in floatnames]
+        if doublenames:
+            lines.insert(1, '        cdef double ' + ', '.join(doublenames))
+        if intnames:
+            lines.insert(1, '        cdef int ' + ', '.join(intnames))
         return Lines(*lines)
 
 
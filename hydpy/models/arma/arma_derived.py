@@ -43,10 +43,7 @@ class Nmb(parametertools.SingleParameter):
         responses = pars.control.responses
         fluxes = pars.model.sequences.fluxes
         self(len(responses))
-        fluxes.qpin.shape = self.value
-        fluxes.qpout.shape = self.value
-        fluxes.qma.shape = self.value
-        fluxes.qar.shape = self.value
+        fluxes.setshapes(self.value)
 
 
 class MaxQ(parametertools.MultiParameter):
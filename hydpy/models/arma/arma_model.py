@@ -76,16 +76,24 @@ def calc_qpin_v1(self):
         |   7 |   1 |  0.0 | empty |  0.0 |  0.0 |
         |   8 |   1 |  0.0 | empty | 12.0 | 12.0 |
 
+        An inflow value of `nan` results in `nan` values for all response
+        functions:
+
+        >>> derived.nmb = 3
+        >>> derived.maxq.shape = 3
+        >>> derived.diffq.shape = 2
+        >>> fluxes.qpin.shape = 3
+        >>> derived.maxq(0.0, 2.0, 6.0)
+        >>> derived.diffq(2., 4.)
+        >>> fluxes.qin = nan
+        >>> model.calc_qpin_v1()
+        >>> fluxes.qpin
+        qpin(nan, nan, nan)
     """
     der = self.parameters.derived.fastaccess
     flu = self.sequences.fluxes.fastaccess
     for idx in range(der.nmb-1):
-        if flu.qin < der.maxq[idx]:
-            flu.qpin[idx] = 0.
-        elif flu.qin < der.maxq[idx+1]:
-            flu.qpin[idx] = flu.qin-der.maxq[idx]
-        else:
-            flu.qpin[idx] = der.diffq[idx]
+        flu.qpin[idx] = min(max(flu.qin-der.maxq[idx], 0.), der.diffq[idx])
     flu.qpin[der.nmb-1] = max(flu.qin-der.maxq[der.nmb-1], 0.)
 
 
@@ -145,7 +153,6 @@ def calc_login_v1(self):
     for idx in range(der.nmb):
         for jdx in range(der.ma_order[idx]-2, -1, -1):
             log.login[idx, jdx+1] = log.login[idx, jdx]
-    for idx in range(der.nmb):
         log.login[idx, 0] = flu.qpin[idx]
 
 
@@ -205,9 +212,10 @@ def calc_qma_v1(self):
     flu = self.sequences.fluxes.fastaccess
     log = self.sequences.logs.fastaccess
     for idx in range(der.nmb):
-        flu.qma[idx] = 0.
+        qma: float = 0.
         for jdx in range(der.ma_order[idx]):
-            flu.qma[idx] += der.ma_coefs[idx, jdx] * log.login[idx, jdx]
+            qma += der.ma_coefs[idx, jdx] * log.login[idx, jdx]
+        flu.qma[idx] = qma
 
 
 def calc_qar_v1(self):
@@ -270,9 +278,10 @@ def calc_qar_v1(self):
     flu = self.sequences.fluxes.fastaccess
     log = self.sequences.logs.fastaccess
     for idx in range(der.nmb):
-        flu.qar[idx] = 0.
+        qar: float = 0.
         for jdx in range(der.ar_order[idx]):
-            flu.qar[idx] += der.ar_coefs[idx, jdx] * log.logout[idx, jdx]
+            qar += der.ar_coefs[idx, jdx] * log.logout[idx, jdx]
+        flu.qar[idx] = qar
 
 
 def calc_qpout_v1(self):
@@ -373,11 +382,10 @@ def calc_logout_v1(self):
     der = self.parameters.derived.fastaccess
     flu = self.sequences.fluxes.fastaccess
     log = self.sequences.logs.fastaccess
-    for idx in range(der.nmb):
-        for jdx in range(der.ar_order[idx]-2, -1, -1):
-            log.logout[idx, jdx+1] = log.logout[idx, jdx]
     for idx in range(der.nmb):
         if der.ar_order[idx] > 0:
+            for jdx in range(der.ar_order[idx]-2, -1, -1):
+                log.logout[idx, jdx+1] = log.logout[idx, jdx]
             log.logout[idx, 0] = flu.qpout[idx]
 
 
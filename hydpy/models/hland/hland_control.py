@@ -34,6 +34,40 @@ class NmbZones(parametertools.SingleParameter):
         (5,)
         >>> states.ic.shape
         (5,)
+
+        The values of all 1-dimensional sequences of the same subgroup
+        are stored in a single contiguous array, but can still be changed
+        independently:
+
+        >>> fluxes.fracrain = 1.
+        >>> fluxes.fracrain
+        fracrain(1.0, 1.0, 1.0, 1.0, 1.0)
+        >>> fluxes.rfc
+        rfc(nan, nan, nan, nan, nan)
+
+        For state sequences, the same holds for the old values, allowing
+        to pass all new to all old values at once:
+
+        >>> from hydpy.core.objecttools import round_
+        >>> states.sm = 1., 2., 3., 4., 5.
+        >>> states.uz = 6.
+        >>> states.new2old()
+        >>> round_(states.sm.old)
+        1.0, 2.0, 3.0, 4.0, 5.0
+        >>> round_(states.uz.old)
+        6.0
+
+        State sequences reshaped individually afterwards are still handled
+        correctly, but one by one:
+
+        >>> states.sm.shape = 2
+        >>> states.sm = 7., 8.
+        >>> states.ic = 9.
+        >>> states.new2old()
+        >>> round_(states.sm.old)
+        7.0, 8.0
+        >>> round_(states.ic.old)
+        9.0, 9.0, 9.0, 9.0, 9.0
     """
     NDIM, TYPE, TIME, SPAN = 0, int, None, (1, None)
 
@@ -49,9 +83,7 @@ class NmbZones(parametertools.SingleParameter):
                 if (par.NDIM > 0) and (name != 'uh'):
                     par.shape = self.value
         for (_name, subseqs) in self.subpars.pars.model.sequences:
-            for (name, seq) in subseqs:
-                if (seq.NDIM > 0) and (name != 'quh'):
-                    seq.shape = self.value
+            subseqs.setshapes(self.value, exclude=('quh',))
 
 
 class ZoneType(hland_parameters.MultiParameter):
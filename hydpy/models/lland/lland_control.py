@@ -53,9 +53,7 @@ class NHRU(parametertools.SingleParameter):
                 if par.NDIM == 1:
                     par.shape = self.value
         for (_name, subseqs) in self.subpars.pars.model.sequences:
-            for (name, seq) in subseqs:
-                if (seq.NDIM == 1) and (seq.name != 'moy'):
-                    seq.shape = self.value
+            subseqs.setshapes(self.value, exclude=('moy',))
 
 
 class FHRU(lland_parameters.MultiParameter):
@@ -247,8 +247,9 @@ def calc_evpo_v1(self):
     con = self.parameters.control.fastaccess
     der = self.parameters.derived.fastaccess
     flu = self.sequences.fluxes.fastaccess
+    idx = der.moy[self.idx_sim]
     for k in range(con.nhru):
-        flu.evpo[k] = con.fln[con.lnk[k]-1, der.moy[self.idx_sim]] * flu.et0[k]
+        flu.evpo[k] = con.fln[con.lnk[k]-1, idx] * flu.et0[k]
 
 
 def calc_nbes_inzp_v1(self):
@@ -366,11 +367,11 @@ def calc_nbes_inzp_v1(self):
     der = self.parameters.derived.fastaccess
     flu = self.sequences.fluxes.fastaccess
     sta = self.sequences.states.fastaccess
+    idx = der.moy[self.idx_sim]
     for k in range(con.nhru):
         if con.lnk[k] != WASSER:
             flu.nbes[k] = \
-                max(flu.nkor[k]+sta.inzp[k] -
-                    der.kinz[con.lnk[k]-1, der.moy[self.idx_sim]], 0.)
+                max(flu.nkor[k]+sta.inzp[k]-der.kinz[con.lnk[k]-1, idx], 0.)
             sta.inzp[k] += flu.nkor[k]-flu.nbes[k]
         else:
             flu.nbes[k] = flu.nkor[k]
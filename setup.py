@@ -53,16 +53,13 @@ setup(name='HydPy',
           'Operating System :: POSIX :: Linux',
           'Operating System :: Microsoft :: Windows',
           'Operating System :: Microsoft :: Windows :: Windows 7',
-          'Programming Language :: Python :: 2',
-          'Programming Language :: Python :: 2.7',
           'Programming Language :: Python :: 3',
-          'Programming Language :: Python :: 3.4',
-          'Programming Language :: Python :: 3.5',
           'Programming Language :: Python :: 3.6',
           'Programming Language :: Python :: Implementation :: CPython',
           'Topic :: Scientific/Engineering'
       ],
       keywords='hydrology modelling water balance rainfall runoff',
+      python_requires='>=3.6',
       packages=packages,
       cmdclass={'build_ext': Cython.Build.build_ext},
       ext_modules=Cython.Build.cythonize(ext_modules),